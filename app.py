@@ -1,9 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
-from datetime import datetime, time as dt_time, timedelta
+from datetime import datetime, time as dt_time
 import pytz
 import os
 import json
+import hashlib
+import functools
+import shutil
+import uuid
+from array import array
+from collections import OrderedDict
+from bisect import insort
+from operator import le
+
+try:
+    import orjson # Optional: faster journal (de)serialization; stdlib json is used without it
+except ImportError:
+    orjson = None
 
 try:
     from PIL import Image, ImageTk
@@ -15,6 +28,8 @@ except ImportError:
 # --- Constants (These will now be initial defaults and then loaded from files) ---
 PIP_VALUE_XAUUSD = 0.1
 USD_PER_PIP_PER_LOT = 10
+PARTIAL_INPUT_DEBOUNCE_MS = 120 # Partial-close fields resync once typing pauses this long
+REVIEW_INPUT_DEBOUNCE_MS = 120 # Review popup drawdown/exit-time fields recompute once typing pauses this long
 
 # Default lists - these will be used to create the initial JSON files if they don't exist.
 DEFAULT_SL_LOGIC = ["Below Support", "ATR Stop", "Structure", "Other"]
@@ -36,15 +51,85 @@ DEFAULT_PARTIAL_CLOSE_REASONS = [
 ]
 
 TIMEFRAME_ENTRIES = ["15m", "30m", "1h", "4h", "1d"]
+# Row/column indices into the screenshot label grid (self.tf_img_labels[TF_IDX[tf]][WHICH_IDX[when]])
+TF_IDX = {"D1": 0, "H4": 1, "H1": 2}
+WHICH_IDX = {"before": 0, "after": 1}
+NO_SCREENSHOT_TEXT = ("No before screenshot", "No after screenshot") # Placeholder per WHICH_IDX column
 MARKET_SESSIONS_UTC = [
     ("Sydney", dt_time(21, 0), dt_time(6, 0)),
     ("Tokyo", dt_time(0, 0), dt_time(9, 0)),
     ("London", dt_time(8, 0), dt_time(17, 0)),
     ("New York", dt_time(13, 0), dt_time(22, 0)),
 ]
-COMMON_TIMEZONES = ["UTC", "US/Eastern", "Europe/London", "Asia/Tokyo", "Australia/Sydney"]
 
-TRADES_FILE = "trades_journal.json" # File where all journal data will be stored
+def _build_session_table():
+    """Returns, for each minute of the UTC day, a bitmask of the sessions open then (bit i = MARKET_SESSIONS_UTC[i])."""
+    table = bytearray(1440)
+    for bit, (name, start, end) in enumerate(MARKET_SESSIONS_UTC):
+        start_min = start.hour * 60 + start.minute
+        end_min = end.hour * 60 + end.minute
+        # Sessions crossing midnight (e.g. Sydney) wrap via the modulo here, not at lookup time
+        for minute in range(start_min, start_min + (end_min - start_min) % 1440):
+            table[minute % 1440] |= 1 << bit
+    return table
+
+SESSION_MASK_AT_MINUTE = _build_session_table()
+
+def _session_label(active_sessions):
+    """Formats open sessions for the Market Session field: pairwise overlaps, a single name, or "Closed"."""
+    if len(active_sessions) > 1:
+        return " / ".join(f"{a}+{b}" for i, a in enumerate(active_sessions) for b in active_sessions[i + 1:])
+    return active_sessions[0] if active_sessions else "Closed"
+
+# Display string for every session bitmask, so a lookup is SESSION_LABELS[SESSION_MASK_AT_MINUTE[minute]]
+SESSION_LABELS = [
+    _session_label(tuple(name for bit, (name, _, _) in enumerate(MARKET_SESSIONS_UTC) if mask >> bit & 1))
+    for mask in range(1 << len(MARKET_SESSIONS_UTC))
+]
+COMMON_TIMEZONES = ["UTC", "US/Eastern", "Europe/London", "Asia/Tokyo", "Australia/Sydney"]
+UTC = pytz.UTC
+
+def _parse_date_time(date_str, time_str):
+    """Parses "YYYY-MM-DD" and "HH:MM" (or "HH") into a naive datetime without going through strptime."""
+    year, month, day = date_str.split("-")
+    hour, _, minute = time_str.partition(":")
+    return datetime(int(year), int(month), int(day), int(hour), int(minute or 0)) # ValueError on bad input
+
+def _hm_to_sec(text):
+    """Returns seconds since midnight for an "H:MM"/"HH:MM" time, or None if it isn't a valid clock time."""
+    hour, sep, minute = text.partition(":")
+    # ASCII digits only: isdigit() also accepts superscript digits, which int() rejects
+    if not (sep and hour.isascii() and hour.isdecimal() and minute.isascii() and minute.isdecimal()
+            and len(hour) <= 2 and len(minute) <= 2):
+        return None
+    hour, minute = int(hour), int(minute)
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 3600 + minute * 60
+
+def _thumb_path_hash(path):
+    """Returns the part of a thumbnail cache key that identifies its source screenshot."""
+    return hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+
+@functools.lru_cache(maxsize=32)
+def _get_tz(name):
+    """Returns the pytz zone for `name`, resolving each name only once."""
+    return pytz.timezone(name)
+
+# Outcome codes kept per trade for the stats bar (see TradingJournalApp._outcome_codes)
+OUTCOME_OPEN = 0
+OUTCOME_WIN = 1
+OUTCOME_LOSS = 2
+OUTCOME_BREAKEVEN = 3
+OUTCOME_OTHER = 4
+OUTCOME_PRICE_FIELD = {"Take Profit Hit": "tp_price", "Stoploss Hit": "sl_price", "Breakeven": "entry_price"} # Outcome -> price it closes at
+OUTCOME_CODES = {"take profit hit": OUTCOME_WIN, "stoploss hit": OUTCOME_LOSS, "breakeven": OUTCOME_BREAKEVEN, "other": OUTCOME_OTHER}
+
+TRADES_FILE = "trades_journal.jsonl" # Journal: a header line with the account balance, then one trade per line
+LEGACY_TRADES_FILE = "trades_journal.json" # Pre-JSONL single-document journal, migrated on first load
+TRADES_EVENTS_FILE = "trades_journal.events.jsonl" # Partial closes logged since the last full rewrite; replayed on load
+EVENTS_COMPACT_THRESHOLD = 200 # Fold the events log into the journal once it holds this many entries
+TREE_ROW_CHUNK = 200 # Review rows are inserted this many at a time as the list is scrolled toward its end
 
 # File paths for playbook options
 PLAYBOOK_DIR = "playbook_data"
@@ -53,13 +138,65 @@ ENTRY_FILE = os.path.join(PLAYBOOK_DIR, "entries.json")
 SL_REASONS_FILE = os.path.join(PLAYBOOK_DIR, "sl_reasons.json")
 TP_REASONS_FILE = os.path.join(PLAYBOOK_DIR, "tp_reasons.json")
 PARTIAL_CLOSE_REASONS_FILE = os.path.join(PLAYBOOK_DIR, "close_reasons.json")
+THUMB_CACHE_DIR = os.path.join(PLAYBOOK_DIR, "thumb_cache") # Decoded screenshot thumbnails, keyed by source path/mtime/size
+IMAGE_READ_BUFFER = 64 * 1024 # Read buffer for decoding screenshots
+THUMB_MEMORY_CACHE_SIZE = 64 # PhotoImage thumbnails kept in memory (least recently used are dropped)
+SCREENSHOTS_DIR = "screenshots" # Attached screenshots are copied here; the journal only stores the relative path
+
+def _to_float(value, default=0.0):
+    """Parses a number typed into a field, returning `default` when it is blank or invalid."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def _differs(text, value):
+    """True when a field's text does not already hold `value` (within 1e-6)."""
+    current = _to_float(text, None)
+    return current is None or abs(current - value) > 1e-6
+
+def _json_dumps_indented(obj):
+    """Serializes obj as 2-space indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _jsonl_line(record):
+    """Serializes one journal record as a compact UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+def _with_item_sorted(options, item, is_sorted):
+    """Returns `options` plus `item` as a sorted tuple, bisecting into it when `is_sorted` says it already is."""
+    items = list(options)
+    if is_sorted:
+        insort(items, item)
+    else: # Shipped defaults are not sorted; the first change sorts the category
+        items.append(item)
+        items.sort()
+    return tuple(items)
+
+def _atomic_write(path, data):
+    """Writes bytes to `path` via a temp file and os.replace, so a crash never leaves it half-written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+_json_loads = orjson.loads if orjson is not None else json.loads # orjson.JSONDecodeError subclasses json's
 
 # --- Trade Class (No change, as it uses dictionaries for info) ---
 class Trade:
+    __slots__ = ("symbol", "timeframe", "info", "tf_screenshots", "review", "partial_closes", "sl_to_be", "_derived", "_outcome_code",
+                 "entry_price_f", "lot_size_f", "account_balance_f", "pc_pnl_sum", "pc_pips_sum", "pc_amount_sum")
+
     def __init__(self, symbol, timeframe, info=None, tf_screenshots=None, review=None, partial_closes=None, sl_to_be=False):
         self.symbol = symbol
         self.timeframe = timeframe
-        self.info = info or {}
+        self.info = {} if info is None else info
         self.tf_screenshots = tf_screenshots or {
             "D1": {"before": None, "after": None},
             "H4": {"before": None, "after": None},
@@ -72,8 +209,48 @@ class Trade:
             "exit_time": "",
             "max_drawdown_pips": "",
         }
-        self.partial_closes = partial_closes or []
+        self.partial_closes = [] if partial_closes is None else partial_closes
         self.sl_to_be = sl_to_be
+        self._derived = None # Cached _trade_totals result; None after an edit
+        self._outcome_code = None # Cached OUTCOME_* code of review["outcome"]; None after an edit
+        # Numeric copies of the info fields used in P&L math, parsed once (info is fixed after entry)
+        self.entry_price_f = _to_float(self.info.get("entry_price"))
+        self.lot_size_f = _to_float(self.info.get("lot_size"))
+        self.account_balance_f = _to_float(self.info.get("account_balance"))
+        # Running totals over partial_closes; add_partial_close keeps them current
+        pnl_sum = pips_sum = amount_sum = 0.0
+        for pc in self.partial_closes:
+            pnl_sum += pc.get("pnl", 0.0)
+            pips_sum += pc.get("pips", 0.0)
+            amount_sum += pc.get("amount", 0.0)
+        self.pc_pnl_sum = pnl_sum
+        self.pc_pips_sum = pips_sum
+        self.pc_amount_sum = amount_sum
+
+    def add_partial_close(self, pc):
+        """Appends a partial close, updating the running sums and dropping cached totals."""
+        self.partial_closes.append(pc)
+        self.pc_pnl_sum += pc.get("pnl", 0.0)
+        self.pc_pips_sum += pc.get("pips", 0.0)
+        self.pc_amount_sum += pc.get("amount", 0.0)
+        self.mark_dirty()
+
+    def totals(self):
+        """Returns (realized P&L, total pips, W/L status), recomputed only after the trade was edited."""
+        if self._derived is None:
+            self._derived = _trade_totals(self)
+        return self._derived
+
+    def outcome_code(self):
+        """Returns the OUTCOME_* code for the review outcome, classified once per edit."""
+        if self._outcome_code is None:
+            self._outcome_code = OUTCOME_CODES.get(self.review.get("outcome", "").lower(), OUTCOME_OPEN)
+        return self._outcome_code
+
+    def mark_dirty(self):
+        """Drops the cached totals; call after changing info, review or partial closes."""
+        self._derived = None
+        self._outcome_code = None
 
     def to_dict(self):
         return {
@@ -88,33 +265,23 @@ class Trade:
 
     @classmethod
     def from_dict(cls, d):
-        default_review = {
+        review_data = {
             "outcome": "",
             "price": "",
             "notes": "",
             "exit_time": "",
             "max_drawdown_pips": "",
         }
-        review_data = d.get("review", {})
-        review_data = {**default_review, **review_data}
+        review_data.update(d.get("review", ()))
 
-        default_tf_screenshots = {
-            "D1": {"before": None, "after": None},
-            "H4": {"before": None, "after": None},
-            "H1": {"before": None, "after": None}
-        }
-        tf_screenshots_data = d.get("tf_screenshots", {})
-        for tf in default_tf_screenshots:
-            if tf not in tf_screenshots_data:
-                tf_screenshots_data[tf] = default_tf_screenshots[tf]
-            else:
-                if "before" not in tf_screenshots_data[tf]:
-                    tf_screenshots_data[tf]["before"] = None
-                if "after" not in tf_screenshots_data[tf]:
-                    tf_screenshots_data[tf]["after"] = None
+        tf_screenshots_data = {tf: {"before": None, "after": None} for tf in ("D1", "H4", "H1")}
+        tf_screenshots_data.update(d.get("tf_screenshots", ()))
+        for shots in tf_screenshots_data.values():
+            shots.setdefault("before", None)
+            shots.setdefault("after", None)
 
-        partial_closes_data = d.get("partial_closes", [])
-        for pc in partial_closes_data:
+        partial_closes_data = d.get("partial_closes") # None lets the constructor create the empty list
+        for pc in partial_closes_data or ():
             pc.setdefault("pips", 0.0)
             if "reason_for_close" not in pc:
                 if "notes" in pc and pc["notes"] is not None:
@@ -129,25 +296,147 @@ class Trade:
         return cls(
             d.get("symbol", ""),
             d.get("timeframe", ""),
-            d.get("info", {}),
+            d.get("info"),
             tf_screenshots_data,
             review_data,
             partial_closes_data,
             sl_to_be=sl_to_be_val
         )
 
+def _trade_totals(trade):
+    """Returns (realized P&L, total pips, W/L status) for a trade, including partial closes."""
+    total_pnl_for_display = trade.pc_pnl_sum
+    total_pips_for_display = trade.pc_pips_sum
+    win_loss_status = "Open"
+
+    review = trade.review
+    entry_price = trade.entry_price_f
+    trade_type = trade.info.get("trade_type", "Buy")
+
+    if review.get("outcome") in ("Take Profit Hit", "Stoploss Hit", "Breakeven", "Other"):
+        try:
+            close_price = float(review.get("price", 0))
+
+            remaining_lot_size = trade.lot_size_f - trade.pc_amount_sum
+
+            if remaining_lot_size > 0:
+                pip_value = PIP_VALUE_XAUUSD
+                if trade_type == "Buy":
+                    pips_moved = (close_price - entry_price) / pip_value
+                else:
+                    pips_moved = (entry_price - close_price) / pip_value
+
+                total_pips_for_display += pips_moved
+                total_pnl_for_display += pips_moved * remaining_lot_size * USD_PER_PIP_PER_LOT
+
+            if total_pnl_for_display > 0:
+                win_loss_status = "Win"
+            elif total_pnl_for_display < 0:
+                win_loss_status = "Loss"
+            else:
+                win_loss_status = "Breakeven"
+
+        except ValueError:
+            pass
+        except Exception:
+            pass
+
+    return total_pnl_for_display, total_pips_for_display, win_loss_status
+
+# Bound format methods for the review columns, looked up once instead of parsing an f-string spec per value
+_fmt_usd = "${:,.2f}".format
+_fmt_pct = "{:,.2f}%".format
+_fmt_pips = "{:,.1f}".format
+
+def _row_tuple(idx, trade, totals):
+    """Builds the Journal Review row values for one trade from its `_trade_totals` result."""
+    total_pnl_for_display, total_pips_for_display, win_loss_status = totals
+    info = trade.info
+    review = trade.review
+    initial_balance = trade.account_balance_f
+
+    profit_usd_value = _fmt_usd(total_pnl_for_display)
+    pnl_value_main_column = profit_usd_value + "*" if trade.partial_closes else profit_usd_value
+
+    gain_pct_value = ""
+    if initial_balance > 0:
+        gain_pct = (total_pnl_for_display / initial_balance) * 100
+        gain_pct_value = _fmt_pct(gain_pct)
+
+    acc_bal_after_value = _fmt_usd(initial_balance + total_pnl_for_display)
+
+    mdd_pips_val = review.get("max_drawdown_pips", "")
+    mdd_usd_val = ""
+    try:
+        mdd_pips_float = float(mdd_pips_val)
+        mdd_usd = mdd_pips_float * trade.lot_size_f * USD_PER_PIP_PER_LOT
+        mdd_usd_val = _fmt_usd(mdd_usd)
+    except (ValueError, TypeError):
+        pass
+
+    sl_to_be_display = "Yes" if trade.sl_to_be else "No"
+
+    return (
+        idx + 1,
+        trade.symbol,
+        info.get("trade_type", ""),
+        info.get("trade_date", ""),
+        info.get("trade_time", ""),
+        info.get("entry_price", ""),
+        info.get("lot_size", ""),
+        info.get("sl_price", ""),
+        info.get("tp_price", ""),
+        info.get("setup", ""),
+        info.get("entry", ""),
+        review.get("outcome", ""),
+        pnl_value_main_column,
+        review.get("notes", ""),
+        _fmt_usd(initial_balance),
+        _fmt_pips(total_pips_for_display),
+        win_loss_status,
+        profit_usd_value,
+        gain_pct_value,
+        acc_bal_after_value,
+        f"{mdd_pips_val}",
+        mdd_usd_val,
+        sl_to_be_display
+    )
+
 # --- TradingJournalApp Class ---
 class TradingJournalApp(tk.Tk):
+    # Buy/Sell toggle looks, applied with a single configure per button
+    _ACTIVE_BUY = dict(bg="#2ecc40", fg="#fff", activebackground="#2ecc40", activeforeground="#fff",
+                       relief="solid", bd=1, highlightthickness=0, font=("Segoe UI", 11, "bold"), cursor="hand2")
+    _ACTIVE_SELL = dict(_ACTIVE_BUY, bg="#ff4136", activebackground="#ff4136")
+    _IDLE = dict(bg="#e0e0e0", fg="#333", activebackground="#e0e0e0", activeforeground="#333",
+                 relief="solid", bd=1, highlightthickness=0, font=("Segoe UI", 11), cursor="hand2")
+
     def __init__(self):
         super().__init__()
         self.title("Trading Journal")
         self.geometry("1500x780")
+        # Every ttk.Entry selects its text on focus; one class binding instead of one per widget
+        self.bind_class("TEntry", "<FocusIn>", self._select_all_on_focus, add="+")
         self.trades = []
+        # Per-trade derived data, parallel to self.trades. A None row marks the trade's entries as stale.
+        self._row_cache = []
+        self._pnl_usd = array("d") # Realized P&L per trade
+        self._outcome_codes = bytearray() # OUTCOME_* per trade
+        self._stale_rows = set() # Indices whose cached row/P&L/outcome must be recomputed
         self.account_balance_var = tk.DoubleVar(value=10000.00)
         self.trade_stats_var = tk.StringVar()
         self._sl_tp_is_updating = False
-
-        # Load playbook options
+        self._trade_type_shown = None # Direction the Buy/Sell buttons currently highlight
+        self._risk_deferred = False # Set while sync_all_sl_tp batches both sides
+        self._recompute_pending = set() # Fields edited since the last idle recompute
+        self._debounced = {} # _debounce key -> (after id, callback) still waiting to run
+        self._wheel_canvas = None # Canvas currently holding the app-wide mouse-wheel bindings
+        self._thumb_cache = OrderedDict() # Thumbnail cache key -> ImageTk.PhotoImage already uploaded to Tk
+        self._saved_balance = None # Balance stored in the journal header; a change forces a full rewrite
+        self._journal_gen = None # Id written in the journal header; the events log only applies to a matching one
+        self._event_count = 0 # Entries currently in TRADES_EVENTS_FILE
+
+        # Playbook options are loaded lazily on first access
         self.load_playbook_options()
 
         self.tab_control = ttk.Notebook(self)
@@ -164,22 +453,21 @@ class TradingJournalApp(tk.Tk):
         self.bal_disp.pack(side="left", padx=(3, 0), pady=(5,0))
         update_bal_btn = ttk.Button(stats_frame, text="Update Balance", command=self.update_balance_popup, width=14)
         update_bal_btn.pack(side="right", padx=(0, 8), pady=(5,0))
-        self._on_focus_select_all(update_bal_btn, self.account_balance_var)
 
         # Journal Entry Tab
         self.journal_tab = ttk.Frame(self.tab_control)
         self.tab_control.add(self.journal_tab, text="Journal Entry")
         self.build_journal_tab()
 
-        # Journal Review Tab
+        # Journal Review and Playbook tabs are built the first time they are selected
+        self.trades_tree = None
+        self._tree_rows = 0 # Trades inserted in the review tree so far; always a prefix of self.trades
         self.review_tab = ttk.Frame(self.tab_control)
         self.tab_control.add(self.review_tab, text="Journal Review")
-        self.build_review_tab()
-
-        # Playbook Tab (NEW)
         self.playbook_tab = ttk.Frame(self.tab_control)
         self.tab_control.add(self.playbook_tab, text="Playbook")
-        self.build_playbook_tab() # Call the new method
+        self._lazy_tabs = {str(self.review_tab): self.build_review_tab, str(self.playbook_tab): self.build_playbook_tab}
+        self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Menubar
         menubar = tk.Menu(self)
@@ -193,56 +481,130 @@ class TradingJournalApp(tk.Tk):
         self.load_trades()
         self.update_stats_bar()
 
-    def _on_focus_select_all(self, widget, tk_var_ref=None):
-        """Binds a function to a widget's <FocusIn> event to select all text."""
-        def select_all(event):
-            event.widget.select_range(0, tk.END)
-            event.widget.icursor(tk.END)
-        widget.bind("<FocusIn>", select_all)
+    @staticmethod
+    def _select_all_on_focus(event):
+        """Selects the whole text of a ttk.Entry when it gains focus."""
+        event.widget.select_range(0, tk.END)
+        event.widget.icursor(tk.END)
 
-    def load_playbook_options(self):
-        """Loads playbook options from JSON files or creates them with defaults."""
-        os.makedirs(PLAYBOOK_DIR, exist_ok=True) # Ensure directory exists
+    @staticmethod
+    def _combo(parent, var, values=(), width=14, **kwargs):
+        """Builds a read-only ttk.Combobox bound to var."""
+        return ttk.Combobox(parent, textvariable=var, values=values, width=width, state="readonly", **kwargs)
 
-        # Helper function to load/create a file
-        def load_or_create(filepath, default_list):
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                except json.JSONDecodeError:
-                    messagebox.showwarning("File Error", f"Corrupted playbook file: {filepath}. Resetting to default.")
-                    # Overwrite corrupted file with defaults
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(default_list, f, indent=2)
-                    return default_list
-            else:
-                # Create file with defaults if it doesn't exist
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(default_list, f, indent=2)
-                return default_list
+    def _on_tab_changed(self, event):
+        """Builds a deferred tab's widgets the first time it is shown."""
+        build = self._lazy_tabs.pop(self.tab_control.select(), None)
+        if build is not None:
+            build()
 
-        self.sl_logic_options = load_or_create(SL_REASONS_FILE, DEFAULT_SL_LOGIC)
-        self.tp_logic_options = load_or_create(TP_REASONS_FILE, DEFAULT_TP_LOGIC)
-        self.setups_options = load_or_create(SETUP_FILE, DEFAULT_SETUPS)
-        self.entries_options = load_or_create(ENTRY_FILE, DEFAULT_ENTRIES)
-        self.partial_close_reasons_options = load_or_create(PARTIAL_CLOSE_REASONS_FILE, DEFAULT_PARTIAL_CLOSE_REASONS)
+    def load_playbook_options(self):
+        """Resets the playbook option lists; each one is read from its JSON file on first access."""
+        self._sl_logic_options = None
+        self._tp_logic_options = None
+        self._setups_options = None
+        self._entries_options = None
+        self._partial_close_reasons_options = None
+        self._option_sets = {} # option name -> frozenset of its values, rebuilt after each change
+        self._options_sorted = {} # option name -> whether its tuple is in sorted order (checked once, then tracked)
+        self._journal_dropdowns_loaded = False
+
+    def _load_or_create(self, filepath, default_list):
+        """Loads a playbook option list from JSON (or creates the file with defaults) as a read-only tuple."""
+        os.makedirs(PLAYBOOK_DIR, exist_ok=True) # Ensure directory exists
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'rb') as f:
+                    return tuple(_json_loads(f.read()))
+            except json.JSONDecodeError: # Also raised by orjson
+                messagebox.showwarning("File Error", f"Corrupted playbook file: {filepath}. Resetting to default.")
+                # Overwrite corrupted file with defaults
+                with open(filepath, 'wb') as f:
+                    f.write(_json_dumps_indented(default_list))
+                return tuple(default_list)
+        else:
+            # Create file with defaults if it doesn't exist
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps_indented(default_list))
+            return tuple(default_list)
+
+    def _playbook_options(self, attr, filepath, default_list):
+        """Returns the cached option list stored in `attr`, loading it on first use."""
+        options = getattr(self, attr)
+        if options is None:
+            options = self._load_or_create(filepath, default_list)
+            setattr(self, attr, options)
+        return options
+
+    @property
+    def sl_logic_options(self):
+        return self._playbook_options("_sl_logic_options", SL_REASONS_FILE, DEFAULT_SL_LOGIC)
+
+    @property
+    def tp_logic_options(self):
+        return self._playbook_options("_tp_logic_options", TP_REASONS_FILE, DEFAULT_TP_LOGIC)
+
+    @property
+    def setups_options(self):
+        return self._playbook_options("_setups_options", SETUP_FILE, DEFAULT_SETUPS)
+
+    @property
+    def entries_options(self):
+        return self._playbook_options("_entries_options", ENTRY_FILE, DEFAULT_ENTRIES)
+
+    @property
+    def partial_close_reasons_options(self):
+        return self._playbook_options("_partial_close_reasons_options", PARTIAL_CLOSE_REASONS_FILE, DEFAULT_PARTIAL_CLOSE_REASONS)
+
+    def _ensure_playbook_loaded(self):
+        """Fills the Journal Entry dropdowns just before one of them is first opened."""
+        if not self._journal_dropdowns_loaded:
+            self.refresh_journal_dropdowns()
+
+    def _store_playbook_options(self, option_name, options, filepath):
+        """Replaces the option tuple behind property `option_name`, saves it and updates the dropdowns."""
+        setattr(self, "_" + option_name, options)
+        self._option_sets.pop(option_name, None)
+        self.save_playbook_options(options, filepath)
+        self.refresh_journal_dropdowns(option_name) # Update the affected dropdown on the main tab
+
+    def _option_set(self, option_name):
+        """Returns a cached set of the options behind `option_name` for duplicate checks."""
+        members = self._option_sets.get(option_name)
+        if members is None:
+            members = self._option_sets[option_name] = frozenset(getattr(self, option_name))
+        return members
+
+    def _is_sorted(self, option_name):
+        """Whether the options behind `option_name` are sorted; scanned on first use, then kept by the edit handlers."""
+        flag = self._options_sorted.get(option_name)
+        if flag is None:
+            items = getattr(self, option_name)
+            flag = self._options_sorted[option_name] = all(map(le, items, items[1:]))
+        return flag
 
     def save_playbook_options(self, options_list, filepath):
         """Saves a list of playbook options to a JSON file."""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(options_list, f, indent=2)
+            data = _json_dumps_indented(list(options_list))
+            with open(filepath, 'wb') as f:
+                f.write(data)
         except Exception as e:
             messagebox.showerror("Save Error", f"Could not save options to {filepath}: {e}")
 
-    def refresh_journal_dropdowns(self):
-        """Refreshes the combobox dropdowns on the Journal Entry tab."""
+    def refresh_journal_dropdowns(self, option_name=None):
+        """Refreshes the combobox dropdowns on the Journal Entry tab, or only those showing `option_name`."""
         # This method will be called after changes are made in the Playbook tab
+        if option_name is not None:
+            if self._journal_dropdowns_loaded: # Otherwise they are filled with current values on first open
+                for combo in self._option_comboboxes.get(option_name, ()):
+                    combo["values"] = getattr(self, option_name)
+            return
         self.sl_reason_combo["values"] = self.sl_logic_options
         self.tp_reason_combo["values"] = self.tp_logic_options
         self.setup_combo["values"] = self.setups_options
         self.entry_combo["values"] = self.entries_options
+        self._journal_dropdowns_loaded = True
         # Partial close reason combo is in the review popup, so it needs to be updated when that opens
         # We can't directly update it here unless it's a global variable or part of a persistent frame.
         # For now, it will refresh when the review popup is opened.
@@ -251,19 +613,21 @@ class TradingJournalApp(tk.Tk):
         # Tkinter Variable definitions
         self.trade_type_var = tk.StringVar(value="Buy")
         self.symbol_var = tk.StringVar(value="XAUUSD")
-        self.trade_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
-        self.trade_time_var = tk.StringVar(value=datetime.now().strftime("%H:%M"))
+        now = datetime.now() # One clock read so date and time agree across a minute boundary
+        self.trade_date_var = tk.StringVar(value=now.strftime("%Y-%m-%d"))
+        self.trade_time_var = tk.StringVar(value=now.strftime("%H:%M"))
         self.market_session_var = tk.StringVar(value="")
         self.timezone_var = tk.StringVar(value="UTC")
         self.entry_price_var = tk.DoubleVar(value=2300.0)
         self.lot_size_var = tk.DoubleVar(value=1.0)
-        self.sl_pips_var = tk.DoubleVar()
-        self.sl_price_var = tk.DoubleVar()
+        # SL/TP fields are plain strings, parsed on demand so partial input like "2." never raises in Tk
+        self.sl_pips_var = tk.StringVar(value="0.0")
+        self.sl_price_var = tk.StringVar(value="0.0")
         self.sl_loss_var = tk.StringVar(value="")
         self.sl_loss_pct_var = tk.StringVar(value="")
         self.sl_reason_var = tk.StringVar()
-        self.tp_pips_var = tk.DoubleVar()
-        self.tp_price_var = tk.DoubleVar()
+        self.tp_pips_var = tk.StringVar(value="0.0")
+        self.tp_price_var = tk.StringVar(value="0.0")
         self.tp_profit_var = tk.StringVar(value="")
         self.tp_profit_pct_var = tk.StringVar(value="")
         self.tp_reason_var = tk.StringVar()
@@ -297,9 +661,7 @@ class TradingJournalApp(tk.Tk):
         account_frame.pack(side="right", padx=10)
         tz_label = ttk.Label(account_frame, text="Time Zone:")
         tz_label.grid(row=1, column=0, sticky="e", pady=(4,0))
-        self.tz_combo = ttk.Combobox(
-            account_frame, textvariable=self.timezone_var, values=COMMON_TIMEZONES, width=15, state="readonly"
-        )
+        self.tz_combo = self._combo(account_frame, self.timezone_var, COMMON_TIMEZONES, 15)
         self.tz_combo.grid(row=1, column=1, sticky="w", padx=(5, 0), pady=(4,0))
 
         # Date, Time, Market Session
@@ -319,12 +681,10 @@ class TradingJournalApp(tk.Tk):
         ttk.Label(entry_frame, text="Entry Price:").pack(side="left")
         entry_entry = ttk.Entry(entry_frame, textvariable=self.entry_price_var, width=8)
         entry_entry.pack(side="left", padx=2)
-        self._on_focus_select_all(entry_entry, self.entry_price_var)
 
         ttk.Label(entry_frame, text="Lot Size:").pack(side="left", padx=(10,2))
         lot_entry = ttk.Entry(entry_frame, textvariable=self.lot_size_var, width=6)
         lot_entry.pack(side="left")
-        self._on_focus_select_all(lot_entry, self.lot_size_var)
 
         # Risk Management Frame (Stop Loss & Take Profit)
         risk_frame = ttk.LabelFrame(self.journal_tab, text="Risk Management")
@@ -337,20 +697,18 @@ class TradingJournalApp(tk.Tk):
         ttk.Label(sl_frame, text="Pips:").pack(side="left", padx=(4,2))
         sl_pips_entry = ttk.Entry(sl_frame, textvariable=self.sl_pips_var, width=8)
         sl_pips_entry.pack(side="left")
-        self._on_focus_select_all(sl_pips_entry, self.sl_pips_var)
 
         ttk.Label(sl_frame, text="Price:").pack(side="left", padx=(8,2))
         sl_price_entry = ttk.Entry(sl_frame, textvariable=self.sl_price_var, width=8)
         sl_price_entry.pack(side="left")
-        self._on_focus_select_all(sl_price_entry, self.sl_price_var)
 
         sl_loss_label = ttk.Label(sl_frame, textvariable=self.sl_loss_var, foreground="red")
         sl_loss_label.pack(side="left", padx=(10,2))
         sl_loss_pct_label = ttk.Label(sl_frame, textvariable=self.sl_loss_pct_var, foreground="red")
         sl_loss_pct_label.pack(side="left", padx=(2,5))
         ttk.Label(sl_frame, text="Reason:").pack(side="left", padx=(10,2))
-        # Updated to use self.sl_logic_options
-        self.sl_reason_combo = ttk.Combobox(sl_frame, textvariable=self.sl_reason_var, values=self.sl_logic_options, width=14, state="readonly")
+        # Values are filled from self.sl_logic_options when the dropdown is first posted
+        self.sl_reason_combo = self._combo(sl_frame, self.sl_reason_var, width=14, postcommand=self._ensure_playbook_loaded)
         self.sl_reason_combo.pack(side="left")
 
         # Take Profit details
@@ -360,36 +718,41 @@ class TradingJournalApp(tk.Tk):
         ttk.Label(tp_frame, text="Pips:").pack(side="left", padx=(4,2))
         tp_pips_entry = ttk.Entry(tp_frame, textvariable=self.tp_pips_var, width=8)
         tp_pips_entry.pack(side="left")
-        self._on_focus_select_all(tp_pips_entry, self.tp_pips_var)
 
         ttk.Label(tp_frame, text="Price:").pack(side="left", padx=(8,2))
         tp_price_entry = ttk.Entry(tp_frame, textvariable=self.tp_price_var, width=8)
         tp_price_entry.pack(side="left")
-        self._on_focus_select_all(tp_price_entry, self.tp_price_var)
 
         tp_profit_label = ttk.Label(tp_frame, textvariable=self.tp_profit_var, foreground="green")
         tp_profit_label.pack(side="left", padx=(10,2))
         tp_profit_pct_label = ttk.Label(tp_frame, textvariable=self.tp_profit_pct_var, foreground="green")
         tp_profit_pct_label.pack(side="left", padx=(2,5))
         ttk.Label(tp_frame, text="Reason:").pack(side="left", padx=(10,2))
-        # Updated to use self.tp_logic_options
-        self.tp_reason_combo = ttk.Combobox(tp_frame, textvariable=self.tp_reason_var, values=self.tp_logic_options, width=14, state="readonly")
+        # Values are filled from self.tp_logic_options when the dropdown is first posted
+        self.tp_reason_combo = self._combo(tp_frame, self.tp_reason_var, width=14, postcommand=self._ensure_playbook_loaded)
         self.tp_reason_combo.pack(side="left")
 
         # Playbook Frame
         playbook_frame = ttk.LabelFrame(self.journal_tab, text="Playbook")
         playbook_frame.pack(padx=10, pady=10, fill="x")
         ttk.Label(playbook_frame, text="Setup:").pack(side="left", padx=(5,2))
-        # Updated to use self.setups_options
-        self.setup_combo = ttk.Combobox(playbook_frame, textvariable=self.setup_var, values=self.setups_options, width=16, state="readonly")
+        # Values are filled from self.setups_options when the dropdown is first posted
+        self.setup_combo = self._combo(playbook_frame, self.setup_var, width=16, postcommand=self._ensure_playbook_loaded)
         self.setup_combo.pack(side="left", padx=(0,8))
         ttk.Label(playbook_frame, text="Entry:").pack(side="left", padx=(5,2))
-        # Updated to use self.entries_options
-        self.entry_combo = ttk.Combobox(playbook_frame, textvariable=self.entry_var, values=self.entries_options, width=12, state="readonly")
+        # Values are filled from self.entries_options when the dropdown is first posted
+        self.entry_combo = self._combo(playbook_frame, self.entry_var, width=12, postcommand=self._ensure_playbook_loaded)
         self.entry_combo.pack(side="left", padx=(0,8))
         ttk.Label(playbook_frame, text="Time Frame Entry:").pack(side="left", padx=(5,2))
-        self.timeframe_combo = ttk.Combobox(playbook_frame, textvariable=self.timeframe_var, values=TIMEFRAME_ENTRIES, width=6, state="readonly")
+        self.timeframe_combo = self._combo(playbook_frame, self.timeframe_var, TIMEFRAME_ENTRIES, 6)
         self.timeframe_combo.pack(side="left", padx=(0,8))
+        # Playbook option name -> Journal Entry comboboxes listing it, for targeted refreshes
+        self._option_comboboxes = {
+            "sl_logic_options": (self.sl_reason_combo,),
+            "tp_logic_options": (self.tp_reason_combo,),
+            "setups_options": (self.setup_combo,),
+            "entries_options": (self.entry_combo,),
+        }
 
         # Timeframe Screenshots Frame
         tfss_frame = ttk.LabelFrame(self.journal_tab, text="Timeframe Screenshots")
@@ -399,37 +762,81 @@ class TradingJournalApp(tk.Tk):
             "H4": {"before": None, "after": None},
             "H1": {"before": None, "after": None}
         }
-        self.tf_img_labels = {}
-        row = 0
-        for tf in ["D1", "H4", "H1"]:
-            ttk.Label(tfss_frame, text=tf, font=("Segoe UI", 10, "bold")).grid(row=row, column=0, padx=8, pady=6, sticky="e")
-            before_lbl = ttk.Label(tfss_frame, text="No before screenshot")
-            before_lbl.grid(row=row, column=1, padx=5)
-            ttk.Button(tfss_frame, text="Attach Before", command=lambda t=tf: self.attach_tf_img(t, "before")).grid(row=row, column=2, padx=2)
-            after_lbl = ttk.Label(tfss_frame, text="No after screenshot")
-            after_lbl.grid(row=row, column=3, padx=5)
-            ttk.Button(tfss_frame, text="Attach After", command=lambda t=tf: self.attach_tf_img(t, "after")).grid(row=row, column=4, padx=2)
-            self.tf_img_labels[(tf, "before")] = before_lbl
-            self.tf_img_labels[(tf, "after")] = after_lbl
-            row += 1
+        self.tf_img_labels = [[None] * len(WHICH_IDX) for _ in TF_IDX]
+        for tf, i in TF_IDX.items():
+            ttk.Label(tfss_frame, text=tf, font=("Segoe UI", 10, "bold")).grid(row=i, column=0, padx=8, pady=6, sticky="e")
+            for which, j in WHICH_IDX.items():
+                img_lbl = ttk.Label(tfss_frame, text=NO_SCREENSHOT_TEXT[j])
+                img_lbl.grid(row=i, column=1 + 2 * j, padx=5)
+                ttk.Button(tfss_frame, text=f"Attach {which.capitalize()}",
+                           command=functools.partial(self.attach_tf_img, tf, which)).grid(row=i, column=2 + 2 * j, padx=2)
+                self.tf_img_labels[i][j] = img_lbl
 
         # Add Trade Button
         ttk.Button(self.journal_tab, text="Add Trade", command=self.add_trade).pack(pady=8)
 
-        # Variable Traces for dynamic updates
-        self.sl_pips_var.trace_add("write", lambda *a: self.update_sl_from_pips())
-        self.sl_price_var.trace_add("write", lambda *a: self.update_sl_from_price())
-        self.tp_pips_var.trace_add("write", lambda *a: self.update_tp_from_pips())
-        self.tp_price_var.trace_add("write", lambda *a: self.update_tp_from_price())
-        self.entry_price_var.trace_add("write", lambda *a: self.sync_all_sl_tp())
-        self.lot_size_var.trace_add("write", lambda *a: self.sync_all_sl_tp())
-        self.account_balance_var.trace_add("write", lambda *a: self.sync_all_sl_tp())
-        self.trade_type_var.trace_add("write", lambda *a: self.sync_all_sl_tp())
-        self.timezone_var.trace_add("write", self.update_market_session)
-        self.trade_date_var.trace_add("write", self.update_market_session)
-        self.trade_time_var.trace_add("write", self.update_market_session)
+        # Variable Traces for dynamic updates, coalesced into one recompute per idle cycle
+        self.sl_pips_var.trace_add("write", lambda *a: self._schedule_recompute("sl_pips"))
+        self.sl_price_var.trace_add("write", lambda *a: self._schedule_recompute("sl_price"))
+        self.tp_pips_var.trace_add("write", lambda *a: self._schedule_recompute("tp_pips"))
+        self.tp_price_var.trace_add("write", lambda *a: self._schedule_recompute("tp_price"))
+        self.entry_price_var.trace_add("write", lambda *a: self._schedule_recompute("all"))
+        self.lot_size_var.trace_add("write", lambda *a: self._schedule_recompute("all"))
+        self.account_balance_var.trace_add("write", lambda *a: self._schedule_recompute("all"))
+        self.trade_type_var.trace_add("write", lambda *a: self._schedule_recompute("all"))
+        self.timezone_var.trace_add("write", lambda *a: self._schedule_recompute("session"))
+        self.trade_date_var.trace_add("write", lambda *a: self._schedule_recompute("session"))
+        self.trade_time_var.trace_add("write", lambda *a: self._schedule_recompute("session"))
         self.update_market_session()
 
+    def _schedule_recompute(self, source):
+        """Records which field changed and runs a single recompute once Tk is idle."""
+        if self._sl_tp_is_updating:
+            return # Programmatic write from inside a recompute
+        if not self._recompute_pending:
+            self.after_idle(self._do_recompute)
+        self._recompute_pending.add(source)
+
+    def _debounce(self, key, delay_ms, fn):
+        """Runs fn once `delay_ms` pass without another call for the same key."""
+        pending = self._debounced.pop(key, None)
+        if pending is not None:
+            self.after_cancel(pending[0])
+        self._debounced[key] = (self.after(delay_ms, lambda: self._flush_debounce(key)), fn)
+
+    def _run_when_idle(self, key, fn):
+        """Runs fn once the event queue drains; further requests for `key` until then are dropped."""
+        if key not in self._debounced:
+            self._debounced[key] = (self.after_idle(lambda: self._flush_debounce(key)), fn)
+
+    def _flush_debounce(self, key):
+        """Runs the call pending for `key` right away, if there is one."""
+        pending = self._debounced.pop(key, None)
+        if pending is not None:
+            after_id, fn = pending
+            self.after_cancel(after_id)
+            fn()
+
+    def _do_recompute(self):
+        pending = self._recompute_pending
+        self._recompute_pending = set()
+
+        if "all" in pending:
+            self.sync_all_sl_tp()
+        else:
+            # The edited side of each SL/TP pair drives the other one
+            if "sl_price" in pending:
+                self.update_sl_from_price()
+            elif "sl_pips" in pending:
+                self.update_sl_from_pips()
+            if "tp_price" in pending:
+                self.update_tp_from_price()
+            elif "tp_pips" in pending:
+                self.update_tp_from_pips()
+
+        if "session" in pending:
+            self.update_market_session()
+
     def build_review_tab(self):
         review_tab_frame = ttk.Frame(self.review_tab)
         review_tab_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -438,7 +845,7 @@ class TradingJournalApp(tk.Tk):
                    "sl_price", "tp_price", "setup", "entry", "outcome", "pnl", "notes",
                    "acc_bal_before", "total_pips", "win_loss", "profit_usd", "gain_pct",
                    "acc_bal_after", "mdd_pips", "mdd_usd", "sl_to_be")
-        self.trades_tree = ttk.Treeview(review_tab_frame, columns=columns, show="headings")
+        self.trades_tree = ttk.Treeview(review_tab_frame, columns=columns, show="headings", height=20)
 
         self.trades_tree.heading("id", text="ID")
         self.trades_tree.heading("symbol", text="Symbol")
@@ -494,9 +901,11 @@ class TradingJournalApp(tk.Tk):
 
         h_scrollbar = ttk.Scrollbar(review_tab_frame, orient="horizontal", command=self.trades_tree.xview)
         v_scrollbar = ttk.Scrollbar(review_tab_frame, orient="vertical", command=self.trades_tree.yview)
-        self.trades_tree.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
+        self._trades_vsb = v_scrollbar
+        self.trades_tree.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=self._on_trades_yview)
 
         h_scrollbar.pack(side="bottom", fill="x")
+        self._trades_tree_pack_anchor = h_scrollbar # refresh_trades_tree re-packs the tree before this widget
         v_scrollbar.pack(side="right", fill="y")
 
         review_button_frame = ttk.Frame(review_tab_frame)
@@ -525,22 +934,21 @@ class TradingJournalApp(tk.Tk):
         # Configure scrolling
         main_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
         
-        # Bind mouse wheel scrolling to the canvas for all platforms
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        canvas.bind_all("<Button-4>", lambda event: canvas.yview_scroll(-1, "units")) # For Linux
-        canvas.bind_all("<Button-5>", lambda event: canvas.yview_scroll(1, "units")) # For Linux
+        # Mouse wheel scrolls the canvas only while the pointer is over it
+        self._bind_wheel_scroll(canvas)
 
 
         # Create a dictionary to hold references to listboxes and entry widgets
         self.playbook_widgets = {}
 
         # Define categories and their corresponding files/option lists
+        # "option" names the property holding the category's (immutable) option tuple
         categories = {
-            "Setup Options": {"options": self.setups_options, "file": SETUP_FILE},
-            "Entry Options": {"options": self.entries_options, "file": ENTRY_FILE},
-            "Stop Loss Reasons": {"options": self.sl_logic_options, "file": SL_REASONS_FILE},
-            "Take Profit Reasons": {"options": self.tp_logic_options, "file": TP_REASONS_FILE},
-            "Partial Close Reasons": {"options": self.partial_close_reasons_options, "file": PARTIAL_CLOSE_REASONS_FILE},
+            "Setup Options": {"option": "setups_options", "file": SETUP_FILE},
+            "Entry Options": {"option": "entries_options", "file": ENTRY_FILE},
+            "Stop Loss Reasons": {"option": "sl_logic_options", "file": SL_REASONS_FILE},
+            "Take Profit Reasons": {"option": "tp_logic_options", "file": TP_REASONS_FILE},
+            "Partial Close Reasons": {"option": "partial_close_reasons_options", "file": PARTIAL_CLOSE_REASONS_FILE},
         }
 
         col_idx = 0
@@ -572,25 +980,25 @@ class TradingJournalApp(tk.Tk):
             button_frame = ttk.Frame(frame)
             button_frame.grid(row=2, column=0, columnspan=3, pady=(5,0))
 
-            add_btn = ttk.Button(button_frame, text="Add", command=lambda lb=listbox, ev=entry_var, opt_list=data["options"], fpath=data["file"]: self._add_playbook_item(lb, ev, opt_list, fpath))
+            add_btn = ttk.Button(button_frame, text="Add", command=lambda lb=listbox, ev=entry_var, opt=data["option"], fpath=data["file"]: self._add_playbook_item(lb, ev, opt, fpath))
             add_btn.pack(side="left", padx=(0,5))
 
-            edit_btn = ttk.Button(button_frame, text="Edit Selected", command=lambda lb=listbox, ev=entry_var, opt_list=data["options"], fpath=data["file"]: self._edit_playbook_item(lb, ev, opt_list, fpath))
+            edit_btn = ttk.Button(button_frame, text="Edit Selected", command=lambda lb=listbox, ev=entry_var, opt=data["option"], fpath=data["file"]: self._edit_playbook_item(lb, ev, opt, fpath))
             edit_btn.pack(side="left", padx=(0,5))
 
-            delete_btn = ttk.Button(button_frame, text="Delete Selected", command=lambda lb=listbox, opt_list=data["options"], fpath=data["file"]: self._delete_playbook_item(lb, opt_list, fpath))
+            delete_btn = ttk.Button(button_frame, text="Delete Selected", command=lambda lb=listbox, opt=data["option"], fpath=data["file"]: self._delete_playbook_item(lb, opt, fpath))
             delete_btn.pack(side="left")
 
             # Store references
             self.playbook_widgets[category_name] = {
                 "listbox": listbox,
                 "entry_var": entry_var,
-                "options_list": data["options"], # Reference to the actual list in self
+                "option_name": data["option"], # Property holding the current option tuple
                 "filepath": data["file"]
             }
 
             # Populate listbox initially
-            self._populate_listbox(listbox, data["options"])
+            self._populate_listbox(listbox, getattr(self, data["option"]))
 
             # Bind selection to entry field for editing
             listbox.bind('<<ListboxSelect>>', lambda e, ev=entry_var, lb=listbox: self._on_playbook_select(e, ev, lb))
@@ -608,11 +1016,35 @@ class TradingJournalApp(tk.Tk):
         main_frame.grid_rowconfigure(row_idx, weight=1)
 
 
+    def _bind_wheel_scroll(self, canvas):
+        """Routes mouse-wheel events to canvas only while the pointer is inside it (or its children)."""
+        def grab(event):
+            canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+            canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units")) # For Linux
+            canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units")) # For Linux
+            self._wheel_canvas = canvas
+        def release(event):
+            # Moving onto the embedded content frame also fires <Leave> on the canvas; keep the binding then
+            inside = str(canvas.winfo_containing(event.x_root, event.y_root) or "")
+            if inside != str(canvas) and not inside.startswith(str(canvas) + "."):
+                self._release_wheel(canvas)
+        canvas.bind("<Enter>", grab)
+        canvas.bind("<Leave>", release)
+        # A popup can close under the pointer without a <Leave>; drop its bindings with it
+        canvas.bind("<Destroy>", lambda e: self._release_wheel(canvas), add="+")
+
+    def _release_wheel(self, canvas):
+        """Removes the app-wide wheel bindings if `canvas` is the one currently holding them."""
+        if self._wheel_canvas is canvas:
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.unbind_all(sequence)
+            self._wheel_canvas = None
+
     def _populate_listbox(self, listbox, options_list):
         """Helper to populate a listbox with options."""
         listbox.delete(0, tk.END)
-        for item in options_list:
-            listbox.insert(tk.END, item)
+        if options_list:
+            listbox.insert(tk.END, *options_list) # One Tk call for the whole list
 
     def _on_playbook_select(self, event, entry_var, listbox):
         """Event handler for listbox selection to populate entry field."""
@@ -622,23 +1054,24 @@ class TradingJournalApp(tk.Tk):
             selected_item = listbox.get(index)
             entry_var.set(selected_item)
 
-    def _add_playbook_item(self, listbox, entry_var, options_list, filepath):
+    def _add_playbook_item(self, listbox, entry_var, option_name, filepath):
         """Adds a new item to the playbook category."""
+        options_list = getattr(self, option_name)
         new_item = entry_var.get().strip()
-        if new_item and new_item not in options_list:
-            options_list.append(new_item)
-            options_list.sort() # Keep it sorted
-            self.save_playbook_options(options_list, filepath)
+        if new_item and new_item not in self._option_set(option_name):
+            options_list = _with_item_sorted(options_list, new_item, self._is_sorted(option_name)) # Keep it sorted
+            self._options_sorted[option_name] = True
+            self._store_playbook_options(option_name, options_list, filepath)
             self._populate_listbox(listbox, options_list)
             entry_var.set("") # Clear entry
-            self.refresh_journal_dropdowns() # Update dropdowns on main tab
         elif not new_item:
             messagebox.showwarning("Input Error", "Please enter an item to add.")
         else:
             messagebox.showinfo("Duplicate", f"'{new_item}' already exists in this category.")
 
-    def _edit_playbook_item(self, listbox, entry_var, options_list, filepath):
+    def _edit_playbook_item(self, listbox, entry_var, option_name, filepath):
         """Edits the selected item in the playbook category."""
+        options_list = getattr(self, option_name)
         selection = listbox.curselection()
         if not selection:
             messagebox.showwarning("Selection Error", "Please select an item to edit.")
@@ -656,21 +1089,22 @@ class TradingJournalApp(tk.Tk):
             messagebox.showinfo("No Change", "The new item is the same as the old one.")
             return
 
-        if new_item in options_list and new_item != old_item: # Check if new item already exists and is different from old
+        if new_item in self._option_set(option_name): # Check if new item already exists and is different from old
             messagebox.showinfo("Duplicate", f"'{new_item}' already exists in this category.")
             return
 
-        # Update the actual list
-        options_list[options_list.index(old_item)] = new_item
-        options_list.sort() # Re-sort after edit
+        # The listbox mirrors the option tuple, so the selection index locates the old item
+        options_list = _with_item_sorted(options_list[:old_item_index] + options_list[old_item_index + 1:], new_item,
+                                         self._is_sorted(option_name))
+        self._options_sorted[option_name] = True
 
-        self.save_playbook_options(options_list, filepath)
+        self._store_playbook_options(option_name, options_list, filepath)
         self._populate_listbox(listbox, options_list)
         entry_var.set("") # Clear entry
-        self.refresh_journal_dropdowns() # Update dropdowns on main tab
 
-    def _delete_playbook_item(self, listbox, options_list, filepath):
+    def _delete_playbook_item(self, listbox, option_name, filepath):
         """Deletes the selected item from the playbook category."""
+        options_list = getattr(self, option_name)
         selection = listbox.curselection()
         if not selection:
             messagebox.showwarning("Selection Error", "Please select an item to delete.")
@@ -678,20 +1112,32 @@ class TradingJournalApp(tk.Tk):
 
         item_to_delete = listbox.get(selection[0])
         if messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete '{item_to_delete}'?"):
-            if item_to_delete in options_list:
-                options_list.remove(item_to_delete)
-                self.save_playbook_options(options_list, filepath)
+            if item_to_delete in self._option_set(option_name):
+                options_list = options_list[:selection[0]] + options_list[selection[0] + 1:]
+                self._store_playbook_options(option_name, options_list, filepath)
                 self._populate_listbox(listbox, options_list)
-                self.refresh_journal_dropdowns() # Update dropdowns on main tab
+
+    def import_screenshot(self, src, tf, when):
+        """Copies a picked image into SCREENSHOTS_DIR and returns the path to store in the journal."""
+        ext = os.path.splitext(src)[1].lower() or ".png"
+        dst = os.path.join(SCREENSHOTS_DIR, f"{uuid.uuid4().hex}_{tf}_{when}{ext}")
+        try:
+            os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+            shutil.copyfile(src, dst)
+        except OSError as e:
+            messagebox.showerror("Screenshot Error", f"Could not copy screenshot into {SCREENSHOTS_DIR}:\n{e}")
+            return None
+        return dst.replace(os.sep, "/")
 
     def attach_tf_img(self, tf, when):
         path = filedialog.askopenfilename(filetypes=[("Images", "*.png;*.jpg;*.jpeg;*.bmp;*.gif")])
+        lbl = self.tf_img_labels[TF_IDX[tf]][WHICH_IDX[when]]
+        if path:
+            path = self.import_screenshot(path, tf, when)
         if path:
             self.tf_screenshots[tf][when] = path
-            lbl = self.tf_img_labels[(tf, when)]
             self._show_img_thumbnail(path, lbl)
         else:
-            lbl = self.tf_img_labels[(tf, when)]
             lbl["text"] = f"No {when} screenshot"
 
     def add_trade(self):
@@ -708,13 +1154,13 @@ class TradingJournalApp(tk.Tk):
             "timezone": self.timezone_var.get(),
             "entry_price": self.entry_price_var.get(),
             "lot_size": self.lot_size_var.get(),
-            "sl_pips": self.sl_pips_var.get(),
-            "sl_price": self.sl_price_var.get(),
+            "sl_pips": _to_float(self.sl_pips_var.get()),
+            "sl_price": _to_float(self.sl_price_var.get()),
             "sl_loss": self.sl_loss_var.get(),
             "sl_loss_pct": self.sl_loss_pct_var.get(),
             "sl_reason": self.sl_reason_var.get(),
-            "tp_pips": self.tp_pips_var.get(),
-            "tp_price": self.tp_price_var.get(),
+            "tp_pips": _to_float(self.tp_pips_var.get()),
+            "tp_price": _to_float(self.tp_price_var.get()),
             "tp_profit": self.tp_profit_var.get(),
             "tp_profit_pct": self.tp_profit_pct_var.get(),
             "tp_reason": self.tp_reason_var.get(),
@@ -723,20 +1169,27 @@ class TradingJournalApp(tk.Tk):
             "account_balance": self.account_balance_var.get(),
         }
 
-        tf_shots = {k: v.copy() for k, v in self.tf_screenshots.items()}
+        # Hand the attached screenshots to the trade and start the form with a fresh set
+        tf_shots = self.tf_screenshots
+        self.tf_screenshots = {tf_name: {"before": None, "after": None} for tf_name in ("D1", "H4", "H1")}
 
         trade = Trade(symbol, tf, info=info, tf_screenshots=tf_shots, sl_to_be=False)
         self.trades.append(trade)
-        self.save_trades()
-        self.refresh_trades_tree()
+        self._row_cache.append(None)
+        self._stale_rows.add(len(self.trades) - 1)
+        self._pnl_usd.append(0.0)
+        self._outcome_codes.append(OUTCOME_OPEN)
+        self.append_trade(trade)
+        self._update_trade_row(len(self.trades) - 1)
         self.update_stats_bar()
 
         self.symbol_var.set("XAUUSD")
         self.timeframe_var.set("")
         self.trade_type_var.set("Buy")
         self._update_trade_type_buttons()
-        self.trade_date_var.set(datetime.now().strftime("%Y-%m-%d"))
-        self.trade_time_var.set(datetime.now().strftime("%H:%M"))
+        now = datetime.now()
+        self.trade_date_var.set(now.strftime("%Y-%m-%d"))
+        self.trade_time_var.set(now.strftime("%H:%M"))
         self.entry_price_var.set(0.0)
         self.lot_size_var.set(0.0)
         self.sl_pips_var.set(0.0)
@@ -749,40 +1202,159 @@ class TradingJournalApp(tk.Tk):
         self.entry_var.set("")
         self.sync_all_sl_tp()
 
-        for tf in ["D1", "H4", "H1"]:
-            for when in ["before", "after"]:
-                self.tf_screenshots[tf][when] = None
-                lbl = self.tf_img_labels[(tf, when)]
-                lbl["text"] = f"No {when} screenshot"
-                lbl["image"] = ""
+        for labels in self.tf_img_labels:
+            for lbl, text in zip(labels, NO_SCREENSHOT_TEXT):
+                lbl.configure(text=text, image="") # One configure call per label
 
     def save_trades(self):
+        """Rewrites the whole journal; used when existing trades or the balance change."""
         try:
-            data_to_save = {
-                "trades": [t.to_dict() for t in self.trades],
-                "account_balance": self.account_balance_var.get()
-            }
-            with open(TRADES_FILE, "w", encoding="utf-8") as f:
-                json.dump(data_to_save, f, indent=2)
+            balance = self.account_balance_var.get()
+            gen = uuid.uuid4().hex
+            # Serialize everything first, then hand the file a single write
+            lines = [_jsonl_line({"account_balance": balance, "events_gen": gen})]
+            lines += [_jsonl_line(t.to_dict()) for t in self.trades]
+            _atomic_write(TRADES_FILE, b"".join(lines))
+            self._saved_balance = balance
+            self._journal_gen = gen
+            # Logged events are part of the rewrite now; a leftover log would not match the new id anyway
+            self._event_count = 0
+            if os.path.exists(TRADES_EVENTS_FILE):
+                os.remove(TRADES_EVENTS_FILE)
+        except Exception as e:
+            messagebox.showerror("Save Failed", str(e))
+
+    def append_partial_close(self, idx, partial_close):
+        """Logs a new partial close of trade `idx` to the events file instead of rewriting the journal."""
+        if (self._journal_gen is None or self._event_count >= EVENTS_COMPACT_THRESHOLD
+                or not os.path.exists(TRADES_FILE) or self.account_balance_var.get() != self._saved_balance):
+            self.save_trades()
+            return
+        try:
+            lines = [] if self._event_count else [_jsonl_line({"events_gen": self._journal_gen})]
+            lines.append(_jsonl_line({"trade": idx, "partial_close": partial_close}))
+            with open(TRADES_EVENTS_FILE, "ab" if self._event_count else "wb") as f:
+                f.write(b"".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+            self._event_count += 1
+        except Exception as e:
+            messagebox.showerror("Save Failed", str(e))
+
+    def _replay_events(self, trades, gen):
+        """Applies logged partial closes written against journal id `gen`; returns how many were applied.
+
+        Never raises for a damaged log: the journal itself is intact, so a bad events file must not
+        reach load_trades' corruption handling."""
+        try:
+            if not os.path.exists(TRADES_EVENTS_FILE):
+                return 0
+            with open(TRADES_EVENTS_FILE, "rb") as f:
+                lines = f.read().splitlines()
+            try:
+                header = _json_loads(lines[0]) if lines else {}
+            except ValueError: # JSONDecodeError (json's or orjson's) is a ValueError
+                header = None
+            if not isinstance(header, dict):
+                # Torn write of the header and first event: nothing in the log can be trusted
+                os.remove(TRADES_EVENTS_FILE)
+                messagebox.showwarning("Partial Closes Discarded",
+                                       f"{TRADES_EVENTS_FILE} was damaged and has been discarded; "
+                                       "partial closes added since the journal was last saved may be missing.")
+                return 0
+            if gen is None or header.get("events_gen") != gen:
+                os.remove(TRADES_EVENTS_FILE) # Left over from before the last full rewrite
+                return 0
+        except OSError as e:
+            messagebox.showwarning("Partial Closes Not Loaded", f"Could not read {TRADES_EVENTS_FILE}: {e}")
+            return 0
+        applied = [lines[0]] # Header plus every event line that was applied
+        for line in lines[1:]:
+            try:
+                event = _json_loads(line)
+                idx, pc = event["trade"], event["partial_close"]
+            except (ValueError, TypeError, KeyError):
+                continue # Torn append or not an event record
+            if not (type(idx) is int and 0 <= idx < len(trades) and isinstance(pc, dict)
+                    and all(isinstance(pc.get(key, 0.0), (int, float)) for key in ("pnl", "pips", "amount"))):
+                continue # Malformed event; checked up front so add_partial_close can't fail halfway
+            trades[idx].add_partial_close(pc)
+            applied.append(line)
+        if len(applied) < len(lines):
+            # Keep only the good events, so the next append starts on a clean line instead of being
+            # glued onto torn bytes (and lost along with them on the following load)
+            try:
+                _atomic_write(TRADES_EVENTS_FILE, b"".join(line + b"\n" for line in applied))
+            except OSError as e:
+                messagebox.showwarning("Partial Closes Not Repaired", f"Could not rewrite {TRADES_EVENTS_FILE}: {e}")
+        return len(applied) - 1
+
+    def append_trade(self, trade):
+        """Appends a single new trade to the journal without rewriting earlier lines."""
+        if not os.path.exists(TRADES_FILE) or self.account_balance_var.get() != self._saved_balance:
+            self.save_trades()
+            return
+        try:
+            with open(TRADES_FILE, "ab") as f:
+                f.write(_jsonl_line(trade.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
         except Exception as e:
             messagebox.showerror("Save Failed", str(e))
 
+    def migrate_legacy_journal(self):
+        """Converts a legacy trades_journal.json into JSONL once and keeps the original as a backup."""
+        if os.path.exists(TRADES_FILE) or not os.path.exists(LEGACY_TRADES_FILE):
+            return
+        try:
+            with open(LEGACY_TRADES_FILE, "rb") as f:
+                data = _json_loads(f.read())
+            lines = [_jsonl_line({"account_balance": data.get("account_balance", 10000.00)})]
+            lines += [_jsonl_line(d) for d in data.get("trades", [])]
+            _atomic_write(TRADES_FILE, b"".join(lines))
+            os.replace(LEGACY_TRADES_FILE, f"{LEGACY_TRADES_FILE}.bak")
+        except Exception as e:
+            messagebox.showwarning("Migration Failed", f"Could not convert {LEGACY_TRADES_FILE} to {TRADES_FILE}: {e}")
+
     def load_trades(self):
+        self.migrate_legacy_journal()
         if not os.path.exists(TRADES_FILE):
-            self.trades = []
+            self.set_trades([])
             self.account_balance_var.set(10000.00)
             self.refresh_trades_tree()
             self.update_stats_bar()
             return
         try:
-            with open(TRADES_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.trades = [Trade.from_dict(d) for d in data.get("trades", [])]
-            self.account_balance_var.set(data.get("account_balance", 10000.00))
+            # One read of the whole file, then parse the lines from memory
+            with open(TRADES_FILE, "rb") as f:
+                lines = f.read().splitlines()
+            header = _json_loads(lines[0]) if lines else {}
+            trade_lines = [line for line in lines[1:] if line.strip()]
+            trades = []
+            torn_tail = False
+            for line_no, line in enumerate(trade_lines, 1):
+                try:
+                    data = _json_loads(line)
+                except json.JSONDecodeError:
+                    if line_no < len(trade_lines):
+                        raise # Damage inside the journal, not just an interrupted append
+                    torn_tail = True # append_trade was cut off; only that trade is lost
+                    break
+                trades.append(Trade.from_dict(data))
+            self._journal_gen = header.get("events_gen")
+            self._event_count = self._replay_events(trades, self._journal_gen)
+
+            self.set_trades(trades)
+            self._prune_thumb_cache(trades) # Screenshots replaced or trades deleted since the last run
+            self.account_balance_var.set(header.get("account_balance", 10000.00))
+            self._saved_balance = self.account_balance_var.get()
 
             self.refresh_trades_tree()
             self.update_stats_bar()
+            if torn_tail:
+                messagebox.showwarning("Journal Repaired",
+                                       f"The last trade in {TRADES_FILE} was only partly written and has been dropped.")
+                self.save_trades() # Rewrite without the torn line so later appends start on a clean line
         except json.JSONDecodeError as e:
             response = messagebox.askyesno(
                 "Corrupted Journal File",
@@ -798,7 +1370,7 @@ class TradingJournalApp(tk.Tk):
                         messagebox.showinfo("Backup Created", f"Corrupted file backed up as '{TRADES_FILE}.bak_{timestamp}'")
                     except Exception as backup_e:
                         messagebox.showwarning("Backup Failed", f"Could not back up corrupted file: {backup_e}\nStarting new journal anyway.")
-                self.trades = []
+                self.set_trades([])
                 self.account_balance_var.set(10000.00)
                 self.refresh_trades_tree()
                 self.update_stats_bar()
@@ -809,129 +1381,90 @@ class TradingJournalApp(tk.Tk):
             messagebox.showerror("Load Failed", f"An unexpected error occurred during load: {e}")
 
     def refresh_trades_tree(self):
-        for i in self.trades_tree.get_children():
-            self.trades_tree.delete(i)
-        for idx, trade in enumerate(self.trades):
-            total_pnl_for_display = 0.0
-            total_pips_for_display = 0.0
-            win_loss_status = "Open"
-
-            initial_balance = trade.info.get("account_balance", 0.0)
-            original_lot_size = float(trade.info.get("lot_size", 0.0))
-            entry_price = float(trade.info.get("entry_price", 0.0))
-            trade_type = trade.info.get("trade_type", "Buy")
-
-            for pc in trade.partial_closes:
-                total_pnl_for_display += pc.get("pnl", 0.0)
-                total_pips_for_display += pc.get("pips", 0.0)
-
-            if trade.review.get("outcome") in ["Take Profit Hit", "Stoploss Hit", "Breakeven", "Other"]:
-                try:
-                    close_price = float(trade.review.get("price", 0))
-
-                    closed_lot_size_partials = sum(pc.get("amount", 0) for pc in trade.partial_closes)
-                    remaining_lot_size = original_lot_size - closed_lot_size_partials
-
-                    if remaining_lot_size > 0:
-                        if trade_type == "Buy":
-                            pips_moved = (close_price - entry_price) / PIP_VALUE_XAUUSD
-                        else:
-                            pips_moved = (entry_price - close_price) / PIP_VALUE_XAUUSD
-
-                        total_pips_for_display += pips_moved
-                        total_pnl_for_display += pips_moved * remaining_lot_size * USD_PER_PIP_PER_LOT
-
-                    if total_pnl_for_display > 0:
-                        win_loss_status = "Win"
-                    elif total_pnl_for_display < 0:
-                        win_loss_status = "Loss"
-                    else:
-                        win_loss_status = "Breakeven"
-
-                except ValueError:
-                    pass
-                except Exception:
-                    pass
-
-            pnl_value_main_column = f"${total_pnl_for_display:,.2f}"
-            if trade.partial_closes:
-                pnl_value_main_column += "*"
-
-            profit_usd_value = f"${total_pnl_for_display:,.2f}"
-            gain_pct_value = ""
-            if initial_balance > 0:
-                gain_pct = (total_pnl_for_display / initial_balance) * 100
-                gain_pct_value = f"{gain_pct:,.2f}%"
-
-            acc_bal_after_value = f"${initial_balance + total_pnl_for_display:,.2f}"
-
-            mdd_pips_val = trade.review.get("max_drawdown_pips", "")
-            mdd_usd_val = ""
-            try:
-                mdd_pips_float = float(mdd_pips_val)
-                lot_size_float = float(trade.info.get("lot_size", 0.0))
-                mdd_usd = mdd_pips_float * lot_size_float * USD_PER_PIP_PER_LOT
-                mdd_usd_val = f"${mdd_usd:,.2f}"
-            except (ValueError, TypeError):
-                pass
-
-            sl_to_be_display = "Yes" if trade.sl_to_be else "No"
-
-            vals = [
-                idx + 1,
-                trade.symbol,
-                trade.info.get("trade_type", ""),
-                trade.info.get("trade_date", ""),
-                trade.info.get("trade_time", ""),
-                trade.info.get("entry_price", ""),
-                trade.info.get("lot_size", ""),
-                trade.info.get("sl_price", ""),
-                trade.info.get("tp_price", ""),
-                trade.info.get("setup", ""),
-                trade.info.get("entry", ""),
-                trade.review.get("outcome", ""),
-                pnl_value_main_column,
-                trade.review.get("notes", ""),
-                f"${initial_balance:,.2f}",
-                f"{total_pips_for_display:,.1f}",
-                win_loss_status,
-                profit_usd_value,
-                gain_pct_value,
-                acc_bal_after_value,
-                f"{mdd_pips_val}",
-                mdd_usd_val,
-                sl_to_be_display
-            ]
-            self.trades_tree.insert("", "end", iid=idx, values=vals)
+        tree = self.trades_tree
+        if tree is None:
+            return # Review tab not built yet; build_review_tab fills the tree when it is
+        # Only the first chunk is inserted; _on_trades_yview adds more as the user scrolls down.
+        # Rows are computed up front so the tree is only unmapped for the Tk calls themselves
+        compute_row = self._compute_row
+        rows = [compute_row(idx) for idx in range(min(len(self.trades), TREE_ROW_CHUNK))]
+        # Unmap the tree while it is rebuilt so Tk lays it out once instead of per inserted row
+        tree.pack_forget()
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        insert = tree.insert
+        for idx, vals in enumerate(rows):
+            insert("", "end", iid=idx, values=vals)
+        self._tree_rows = len(rows)
+        tree.pack(fill="both", expand=True, before=self._trades_tree_pack_anchor)
+
+    def _on_trades_yview(self, first, last):
+        """Scrollbar callback of the review tree; inserts the next chunk of rows when the end comes into view."""
+        self._trades_vsb.set(first, last)
+        if float(last) >= 0.9 and self._tree_rows < len(self.trades):
+            self.after_idle(self._insert_more_tree_rows)
+
+    def _insert_more_tree_rows(self):
+        """Appends up to TREE_ROW_CHUNK not-yet-inserted trades to the review tree."""
+        start = self._tree_rows
+        end = min(len(self.trades), start + TREE_ROW_CHUNK)
+        if start >= end:
+            return # Already handled by an earlier idle callback
+        insert = self.trades_tree.insert
+        compute_row = self._compute_row
+        for idx in range(start, end):
+            insert("", "end", iid=idx, values=compute_row(idx))
+        self._tree_rows = end
+
+    def _update_trade_row(self, idx):
+        """Pushes trade `idx`'s row to the review tree, inserting it if it is next in line."""
+        tree = self.trades_tree
+        if tree is None:
+            return
+        if idx < self._tree_rows:
+            tree.item(idx, values=self._compute_row(idx))
+        elif idx == self._tree_rows:
+            tree.insert("", "end", iid=idx, values=self._compute_row(idx))
+            self._tree_rows += 1
+        # Rows further down are inserted when the list is scrolled to them
+
+    def set_trades(self, trades):
+        """Replaces the loaded trades and drops every cached row."""
+        self.trades = trades
+        self._row_cache = [None] * len(trades)
+        self._stale_rows = set(range(len(trades)))
+        self._pnl_usd = array("d", bytes(8 * len(trades)))
+        self._outcome_codes = bytearray(len(trades))
+
+    def invalidate_trade(self, idx):
+        """Marks the cached row of trade `idx` as stale after the trade was edited."""
+        self._row_cache[idx] = None
+        self._stale_rows.add(idx)
+        self.trades[idx].mark_dirty()
+
+    def _compute_row(self, idx):
+        """Returns the cached row values of trade `idx`, rebuilding its derived data when stale."""
+        row = self._row_cache[idx]
+        if row is None:
+            trade = self.trades[idx]
+            totals = trade.totals()
+            row = self._row_cache[idx] = _row_tuple(idx, trade, totals)
+            self._stale_rows.discard(idx)
+            self._pnl_usd[idx] = totals[0]
+            self._outcome_codes[idx] = trade.outcome_code()
+        return row
 
     def update_stats_bar(self):
         total = len(self.trades)
-        total_realized_pnl = 0.0
-        for trade in self.trades:
-            for pc in trade.partial_closes:
-                total_realized_pnl += pc.get("pnl", 0.0)
-
-            if trade.review.get("outcome") in ["Take Profit Hit", "Stoploss Hit", "Breakeven", "Other"]:
-                try:
-                    entry_price = float(trade.info.get("entry_price", 0))
-                    close_price = float(trade.review.get("price", 0))
-                    original_lot_size = float(trade.info.get("lot_size", 0))
-                    trade_type = trade.info.get("trade_type", "Buy")
-
-                    closed_lot_size_partials = sum(pc.get("amount", 0) for pc in trade.partial_closes)
-                    remaining_lot_size = original_lot_size - closed_lot_size_partials
-
-                    if remaining_lot_size > 0:
-                        if trade_type == "Buy":
-                            pips_moved = (close_price - entry_price) / PIP_VALUE_XAUUSD
-                        else:
-                            pips_moved = (entry_price - close_price) / PIP_VALUE_XAUUSD
-                        total_realized_pnl += pips_moved * remaining_lot_size * USD_PER_PIP_PER_LOT
-                except ValueError:
-                    pass
-
-        wins = sum(1 for t in self.trades if t.review.get("outcome", "").lower() == "take profit hit")
-        losses = sum(1 for t in self.trades if t.review.get("outcome", "").lower() == "stoploss hit")
+        # Only trades edited since the last refresh are recomputed; the rest come from the columns below
+        for idx in tuple(self._stale_rows):
+            self._compute_row(idx)
+
+        # Column-wise reductions run in C over the packed arrays
+        total_realized_pnl = sum(self._pnl_usd)
+        wins = self._outcome_codes.count(OUTCOME_WIN)
+        losses = self._outcome_codes.count(OUTCOME_LOSS)
         wr = int(round(100 * wins / total)) if total > 0 else 0
 
         self.trade_stats_var.set(f"Trade Count {total}  Win {wins}  Loss {losses}  {wr}%WR | Realized P&L: ${total_realized_pnl:,.2f}")
@@ -968,14 +1501,19 @@ class TradingJournalApp(tk.Tk):
             canvas.configure(scrollregion=canvas.bbox("all"))
         frame.bind("<Configure>", on_frame_configure)
         
-        # Bind mouse wheel scrolling to the canvas for all platforms in popup
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        canvas.bind_all("<Button-4>", lambda event: canvas.yview_scroll(-1, "units")) # For Linux
-        canvas.bind_all("<Button-5>", lambda event: canvas.yview_scroll(1, "units")) # For Linux
+        # Mouse wheel scrolls the popup only while the pointer is over it
+        self._bind_wheel_scroll(canvas)
 
 
         info = trade.info
         review = trade.review
+        # Numeric view of the (read-only here) trade fields that the popup's callbacks use on every edit
+        nums = {
+            "entry_price": trade.entry_price_f,
+            "lot_size": trade.lot_size_f,
+            "tp_price": _to_float(info.get("tp_price")),
+            "sl_price": _to_float(info.get("sl_price")),
+        }
 
         info_frame = ttk.LabelFrame(frame, text="Trade Details (View Only)")
         info_frame.pack(padx=10, pady=5, fill="x")
@@ -1038,30 +1576,27 @@ class TradingJournalApp(tk.Tk):
         partial_amount_var = tk.DoubleVar(value=0.0)
         partial_amount_entry = ttk.Entry(add_partial_frame, textvariable=partial_amount_var, width=8)
         partial_amount_entry.grid(row=0, column=1, padx=2, pady=2)
-        self._on_focus_select_all(partial_amount_entry, partial_amount_var)
 
         ttk.Label(add_partial_frame, text="Pips:").grid(row=0, column=2, padx=2, pady=2)
         partial_pips_var = tk.DoubleVar(value=0.0)
         partial_pips_entry = ttk.Entry(add_partial_frame, textvariable=partial_pips_var, width=8)
         partial_pips_entry.grid(row=0, column=3, padx=2, pady=2)
-        self._on_focus_select_all(partial_pips_entry, partial_pips_var)
 
         ttk.Label(add_partial_frame, text="Price:").grid(row=0, column=4, padx=2, pady=2)
         partial_price_var = tk.DoubleVar(value=0.0)
         partial_price_entry = ttk.Entry(add_partial_frame, textvariable=partial_price_var, width=8, state="normal")
         partial_price_entry.grid(row=0, column=5, padx=2, pady=2)
-        self._on_focus_select_all(partial_price_entry, partial_price_var)
 
         ttk.Label(add_partial_frame, text="Reason for Close:").grid(row=0, column=6, padx=2, pady=2)
         partial_reason_var = tk.StringVar(value="")
         # Updated to use self.partial_close_reasons_options
-        partial_reason_combo = ttk.Combobox(add_partial_frame, textvariable=partial_reason_var,
-                                            values=self.partial_close_reasons_options, width=25, state="readonly")
+        partial_reason_combo = self._combo(add_partial_frame, partial_reason_var,
+                                           self.partial_close_reasons_options, 25)
         partial_reason_combo.grid(row=0, column=7, padx=2, pady=2)
 
-        committed_closed_lots = sum(pc.get("amount", 0.0) for pc in trade.partial_closes)
-        original_lot_size = info.get("lot_size", 0.0)
-        entry_price = float(info.get("entry_price", 0))
+        committed_closed_lots = trade.pc_amount_sum
+        original_lot_size = nums["lot_size"]
+        entry_price = nums["entry_price"]
         trade_type = info.get("trade_type", "Buy")
 
         remaining_lot_preview_var = tk.DoubleVar(value=original_lot_size - committed_closed_lots)
@@ -1133,7 +1668,7 @@ class TradingJournalApp(tk.Tk):
 
                 if current_partial_amount > 0:
                     calculated_pnl = current_partial_pips * current_partial_amount * USD_PER_PIP_PER_LOT
-                    current_partial_pnl_display_var.set(f"${calculated_pnl:,.2f}")
+                    current_partial_pnl_display_var.set(_fmt_usd(calculated_pnl))
                 else:
                     current_partial_pnl_display_var.set("$0.00")
             except (ValueError, tk.TclError):
@@ -1143,13 +1678,41 @@ class TradingJournalApp(tk.Tk):
                 remaining_lot_preview_var.set(original_lot_size - committed_closed_lots)
                 current_partial_pnl_display_var.set("Error")
 
-        partial_amount_var.trace_add("write", _update_partial_previews)
-        partial_pips_var.trace_add("write", _update_partial_price_from_pips)
-        partial_price_var.trace_add("write", _update_partial_pips_from_price)
+        pending_partial_updates = {} # Resync callback -> after id, one slot per partial field
+
+        def _debounced(fn):
+            """Wraps a partial-field trace so only the last edit in a burst runs `fn`."""
+            def schedule(*args):
+                if is_updating_partial_sync: return
+                after_id = pending_partial_updates.pop(fn, None)
+                if after_id is not None:
+                    popup.after_cancel(after_id)
+                pending_partial_updates[fn] = popup.after(PARTIAL_INPUT_DEBOUNCE_MS, lambda: _flush_partial_update(fn))
+            return schedule
+
+        def _flush_partial_update(only=None):
+            """Runs the pending resync for `only`, or every pending one (in the order they were scheduled)."""
+            for fn in [only] if only is not None else list(pending_partial_updates):
+                after_id = pending_partial_updates.pop(fn, None)
+                if after_id is not None:
+                    popup.after_cancel(after_id)
+                    fn()
+
+        def _cancel_partial_updates(event):
+            if event.widget is popup: # <Destroy> also fires here for every child widget
+                for after_id in pending_partial_updates.values():
+                    popup.after_cancel(after_id)
+                pending_partial_updates.clear()
+        popup.bind("<Destroy>", _cancel_partial_updates, add="+")
+
+        partial_amount_var.trace_add("write", _debounced(_update_partial_previews))
+        partial_pips_var.trace_add("write", _debounced(_update_partial_price_from_pips))
+        partial_price_var.trace_add("write", _debounced(_update_partial_pips_from_price))
 
         _update_partial_previews()
 
         def add_partial_close_entry():
+            _flush_partial_update() # Apply a resync still waiting on the debounce before reading the fields
             try:
                 amount = partial_amount_var.get()
                 price = partial_price_var.get()
@@ -1160,7 +1723,7 @@ class TradingJournalApp(tk.Tk):
                     messagebox.showwarning("Invalid Input", "Amount must be positive and Price/Pips must not be zero for partial close.")
                     return
 
-                current_remaining_lots_before_this_partial = original_lot_size - sum(pc.get("amount", 0.0) for pc in trade.partial_closes)
+                current_remaining_lots_before_this_partial = original_lot_size - trade.pc_amount_sum
                 if amount > current_remaining_lots_before_this_partial + 0.0001:
                     messagebox.showwarning("Invalid Input", f"Partial amount ({amount}) exceeds remaining lot size ({current_remaining_lots_before_this_partial:.2f}).")
                     return
@@ -1179,14 +1742,15 @@ class TradingJournalApp(tk.Tk):
                     "reason_for_close": reason_for_close,
                     "pnl": partial_pnl
                 }
-                trade.partial_closes.append(new_partial)
+                trade.add_partial_close(new_partial)
+                self.invalidate_trade(idx)
 
                 nonlocal committed_closed_lots
-                committed_closed_lots = sum(pc.get("amount", 0.0) for pc in trade.partial_closes)
+                committed_closed_lots = trade.pc_amount_sum
 
                 self.refresh_partial_tree(partial_tree, trade)
-                self.save_trades()
-                self.refresh_trades_tree()
+                self.append_partial_close(idx, new_partial)
+                self._update_trade_row(idx)
                 self.update_stats_bar()
 
                 partial_amount_var.set(0.0)
@@ -1221,51 +1785,60 @@ class TradingJournalApp(tk.Tk):
 
         sl_to_be_var = tk.BooleanVar(value=trade.sl_to_be)
 
+        price_entry_state = None # Last state given to price_entry, to skip no-op configures
+
+        def _set_price_entry_state(state):
+            nonlocal price_entry_state
+            if state != price_entry_state:
+                price_entry.config(state=state)
+                price_entry_state = state
+
         def sync_price_field(*args):
             outcome = outcome_var.get()
-            try:
-                entry_price = float(info.get("entry_price", 0))
-                tp_price = float(info.get("tp_price", 0))
-                sl_price = float(info.get("sl_price", 0))
-            except ValueError:
-                entry_price = tp_price = sl_price = 0.0
-
-            if outcome == "Take Profit Hit":
-                close_price_var.set(f"{tp_price:.2f}")
-                price_entry.config(state="readonly")
-            elif outcome == "Stoploss Hit":
-                close_price_var.set(f"{sl_price:.2f}")
-                price_entry.config(state="readonly")
-            elif outcome == "Breakeven":
-                close_price_var.set(f"{entry_price:.2f}")
-                price_entry.config(state="readonly")
-            elif outcome == "Other":
-                price_entry.config(state="normal")
-                if close_price_var.get() == "0.0" or close_price_var.get() == "":
-                    close_price_var.set("")
-            else:
-                if close_price_var.get() == "0.0" or close_price_var.get() == "":
-                    close_price_var.set("")
-                price_entry.config(state="readonly")
+            price_field = OUTCOME_PRICE_FIELD.get(outcome)
+            if price_field is not None: # TP/SL/BE close at a known price
+                close_price_var.set(f"{nums[price_field]:.2f}")
+                _set_price_entry_state("readonly")
+                return
+            if close_price_var.get() in ("0.0", ""):
+                close_price_var.set("")
+            _set_price_entry_state("normal" if outcome == "Other" else "readonly")
 
         _mdd_is_updating = False
+        # Numeric value of each drawdown field, kept in step with writes made by the sync
+        # itself; None once the user edits the field, so only typed text gets parsed
+        mdd_num = {"pips": None, "price": None}
+
+        def _mdd_value(key, var):
+            value = mdd_num[key]
+            if value is None:
+                text = var.get()
+                value = mdd_num[key] = float(text) if text else 0.0
+            return value
 
         def _update_mdd_usd_from_pips(*args):
             nonlocal _mdd_is_updating
             if _mdd_is_updating: return
             _mdd_is_updating = True
             try:
-                mdd_pips_str = max_drawdown_pips_var.get()
-                mdd_pips = float(mdd_pips_str) if mdd_pips_str else 0.0
+                mdd_pips = _mdd_value("pips", max_drawdown_pips_var)
 
-                lot_size = float(info.get("lot_size", 0.0))
-                mdd_usd = mdd_pips * lot_size * USD_PER_PIP_PER_LOT
-                max_drawdown_usd_var.set(f"${mdd_usd:,.2f}")
+                # USD and price both follow from the same parsed pips
+                mdd_usd = mdd_pips * nums["lot_size"] * USD_PER_PIP_PER_LOT
+                if info.get("trade_type", "Buy") == "Buy":
+                    mdd_price = nums["entry_price"] - (mdd_pips * PIP_VALUE_XAUUSD)
+                else:
+                    mdd_price = nums["entry_price"] + (mdd_pips * PIP_VALUE_XAUUSD)
 
-                _update_mdd_price_from_pips_internal()
+                max_drawdown_usd_var.set(_fmt_usd(mdd_usd))
+                mdd_price = round(mdd_price, 2) # As displayed in the price field
+                if abs(_mdd_value("price", max_drawdown_price_var) - mdd_price) > 1e-6:
+                    max_drawdown_price_var.set(f"{mdd_price:.2f}")
+                    mdd_num["price"] = mdd_price
             except (ValueError, tk.TclError):
                 max_drawdown_usd_var.set("")
                 max_drawdown_price_var.set("")
+                mdd_num["price"] = 0.0
             finally:
                 _mdd_is_updating = False
 
@@ -1274,14 +1847,14 @@ class TradingJournalApp(tk.Tk):
             if _mdd_is_updating: return
             _mdd_is_updating = True
             try:
-                entry_price = float(info.get("entry_price", 0.0))
-                mdd_price_str = max_drawdown_price_var.get()
-                mdd_price = float(mdd_price_str) if mdd_price_str else 0.0
+                entry_price = nums["entry_price"]
+                mdd_price = _mdd_value("price", max_drawdown_price_var)
                 trade_type = info.get("trade_type", "Buy")
 
                 if entry_price == 0:
                     max_drawdown_pips_var.set("")
                     max_drawdown_usd_var.set("")
+                    mdd_num["pips"] = 0.0
                     return
 
                 if trade_type == "Buy":
@@ -1289,52 +1862,31 @@ class TradingJournalApp(tk.Tk):
                 else:
                     pips = (mdd_price - entry_price) / PIP_VALUE_XAUUSD
 
-                if pips < 0: pips = 0.0
+                pips = round(max(pips, 0.0), 1) # As displayed in the pips field
 
-                if abs(float(max_drawdown_pips_var.get() or 0.0) - pips) > 1e-6:
+                if abs(_mdd_value("pips", max_drawdown_pips_var) - pips) > 1e-6:
                     max_drawdown_pips_var.set(f"{pips:.1f}")
-
-                _update_mdd_usd_from_pips()
+                    mdd_num["pips"] = pips
+                max_drawdown_usd_var.set(_fmt_usd(pips * nums["lot_size"] * USD_PER_PIP_PER_LOT))
             except (ValueError, tk.TclError):
                 max_drawdown_pips_var.set("")
                 max_drawdown_usd_var.set("")
+                mdd_num["pips"] = 0.0
             finally:
                 _mdd_is_updating = False
 
-        def _update_mdd_price_from_pips_internal():
-            try:
-                entry_price = float(info.get("entry_price", 0.0))
-                mdd_pips_str = max_drawdown_pips_var.get()
-                mdd_pips = float(mdd_pips_str) if mdd_pips_str else 0.0
-                trade_type = info.get("trade_type", "Buy")
-
-                if trade_type == "Buy":
-                    mdd_price = entry_price - (mdd_pips * PIP_VALUE_XAUUSD)
-                else:
-                    mdd_price = entry_price + (mdd_pips * PIP_VALUE_XAUUSD)
-
-                if abs(float(max_drawdown_price_var.get() or 0.0) - mdd_price) > 1e-6:
-                    max_drawdown_price_var.set(f"{mdd_price:.2f}")
-            except (ValueError, tk.TclError):
-                max_drawdown_price_var.set("")
-
         outcome_options = ["", "Take Profit Hit", "Stoploss Hit", "Breakeven", "Other"]
         ttk.Label(review_frame, text="Outcome:").grid(row=0, column=0, padx=4, pady=4, sticky="e")
-        outcome_combo = ttk.Combobox(
-            review_frame, textvariable=outcome_var,
-            values=outcome_options, width=18, state="readonly"
-        )
+        outcome_combo = self._combo(review_frame, outcome_var, outcome_options, 18)
         outcome_combo.grid(row=0, column=1, padx=4, pady=4, sticky="w")
 
         ttk.Label(review_frame, text="Final Close Price:").grid(row=0, column=2, padx=4, pady=4, sticky="e")
         price_entry = ttk.Entry(review_frame, textvariable=close_price_var, width=16)
         price_entry.grid(row=0, column=3, padx=4, pady=4, sticky="w")
-        self._on_focus_select_all(price_entry, close_price_var)
 
         ttk.Label(review_frame, text="Exit Time:").grid(row=1, column=0, padx=4, pady=4, sticky="e")
         exit_time_entry = ttk.Entry(review_frame, textvariable=exit_time_var, width=16)
         exit_time_entry.grid(row=1, column=1, padx=4, pady=4, sticky="w")
-        self._on_focus_select_all(exit_time_entry, exit_time_var)
 
         ttk.Label(review_frame, text="Time in Trade:").grid(row=1, column=2, padx=4, pady=4, sticky="e")
         time_in_trade_label = ttk.Label(review_frame, textvariable=time_in_trade_var, font=("Segoe UI", 9, "bold"))
@@ -1343,7 +1895,6 @@ class TradingJournalApp(tk.Tk):
         ttk.Label(review_frame, text="Max Drawdown (Pips):").grid(row=2, column=0, padx=4, pady=4, sticky="e")
         max_drawdown_pips_entry = ttk.Entry(review_frame, textvariable=max_drawdown_pips_var, width=16)
         max_drawdown_pips_entry.grid(row=2, column=1, padx=4, pady=4, sticky="w")
-        self._on_focus_select_all(max_drawdown_pips_entry, max_drawdown_pips_var)
 
         ttk.Label(review_frame, text="Max Drawdown ($):").grid(row=2, column=2, padx=4, pady=4, sticky="e")
         max_drawdown_usd_label = ttk.Label(review_frame, textvariable=max_drawdown_usd_var, font=("Segoe UI", 9, "bold"))
@@ -1352,7 +1903,6 @@ class TradingJournalApp(tk.Tk):
         ttk.Label(review_frame, text="Max Drawdown Price:").grid(row=3, column=0, padx=4, pady=4, sticky="e")
         max_drawdown_price_entry = ttk.Entry(review_frame, textvariable=max_drawdown_price_var, width=16)
         max_drawdown_price_entry.grid(row=3, column=1, padx=4, pady=4, sticky="w")
-        self._on_focus_select_all(max_drawdown_price_entry, max_drawdown_price_var)
 
         sl_to_be_checkbox = ttk.Checkbutton(
             review_frame,
@@ -1367,98 +1917,79 @@ class TradingJournalApp(tk.Tk):
         notes_text.grid(row=6, column=1, sticky="w", padx=4, pady=4, columnspan=3)
 
         def calculate_time_in_trade(*args):
-            try:
-                trade_date = info.get("trade_date", "")
-                trade_time = info.get("trade_time", "")
-                exit_time = exit_time_var.get()
+            trade_date = info.get("trade_date", "")
+            trade_time = info.get("trade_time", "")
+            exit_time = exit_time_var.get()
 
-                if not trade_date or not trade_time or not exit_time:
-                    time_in_trade_var.set("N/A")
-                    return
-
-                start_dt_str = f"{trade_date} {trade_time}"
-                end_dt_str = f"{trade_date} {exit_time}"
-
-                start_dt = datetime.strptime(start_dt_str, "%Y-%m-%d %H:%M")
-                end_dt = datetime.strptime(end_dt_str, "%Y-%m-%d %H:%M")
-
-                duration = end_dt - start_dt
-
-                if duration < timedelta(0):
-                    duration += timedelta(days=1)
-
-                total_seconds = duration.total_seconds()
-                hours = int(total_seconds // 3600)
-                minutes = int((total_seconds % 3600) // 60)
-
-                time_in_trade_var.set(f"{hours}h {minutes}m")
-            except ValueError:
-                time_in_trade_var.set("Invalid Time")
-            except Exception:
+            if not trade_date or not trade_time or not exit_time:
                 time_in_trade_var.set("N/A")
+                return
 
-        outcome_var.trace_add("write", sync_price_field)
-        exit_time_var.trace_add("write", calculate_time_in_trade)
-        max_drawdown_pips_var.trace_add("write", _update_mdd_usd_from_pips)
-        max_drawdown_price_var.trace_add("write", _update_mdd_pips_from_price)
-
-        sync_price_field()
-        calculate_time_in_trade()
-        _update_mdd_usd_from_pips()
-
-        def show_image_popup(img_path):
-            try:
-                img = Image.open(img_path)
-                popup_img = tk.Toplevel(popup)
-                popup_img.title("Screenshot Preview")
-                max_w, max_h = 1200, 900
-                w, h = img.size
-                scale = min(1, max_w / w, max_h / h)
-                if scale < 1:
-                    img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-                tkimg = ImageTk.PhotoImage(img)
-                lbl = tk.Label(popup_img, image=tkimg)
-                lbl.image = tkimg
-                lbl.pack()
-                popup_img.transient(popup)
-                popup_img.grab_set()
-                popup_img.focus_force()
-            except Exception as e:
-                messagebox.showerror("Image Error", f"Could not open image:\n{e}")
+            entry_sec = _hm_to_sec(trade_time)
+            exit_sec = _hm_to_sec(exit_time)
+            if entry_sec is None or exit_sec is None:
+                time_in_trade_var.set("Invalid Time")
+                return
+
+            # Entry and exit share the trade date, so only the clock times matter;
+            # an exit earlier than the entry is taken to be on the next day
+            dur = (exit_sec - entry_sec) % 86400
+            time_in_trade_var.set(f"{dur // 3600}h {(dur % 3600) // 60}m")
+
+        outcome_var.trace_add("write", lambda *a: self._run_when_idle((popup, "outcome"), sync_price_field))
+        # Typed fields recompute once the user pauses; writes made by the sync itself are skipped here
+        # (as the functions' own guard would) so a late run can't overwrite what the user typed
+        exit_time_var.trace_add("write", lambda *a: self._debounce(
+            (popup, "exit_time"), REVIEW_INPUT_DEBOUNCE_MS, calculate_time_in_trade))
+        def _on_mdd_edit(key, fn):
+            def on_write(*args):
+                if _mdd_is_updating: return
+                mdd_num[key] = None # Typed text: parse it on the next read
+                self._debounce((popup, "mdd_" + key), REVIEW_INPUT_DEBOUNCE_MS, fn)
+            return on_write
+
+        max_drawdown_pips_var.trace_add("write", _on_mdd_edit("pips", _update_mdd_usd_from_pips))
+        max_drawdown_price_var.trace_add("write", _on_mdd_edit("price", _update_mdd_pips_from_price))
+
+        # Initial sync runs once the popup is built, folded together with any trace fired meanwhile
+        self._run_when_idle((popup, "outcome"), sync_price_field)
+        self._run_when_idle((popup, "exit_time"), calculate_time_in_trade)
+        self._run_when_idle((popup, "mdd_pips"), _update_mdd_usd_from_pips)
 
         tf_frame = ttk.LabelFrame(frame, text="Timeframe Screenshots (Review/Edit)")
         tf_frame.pack(padx=10, pady=5, fill="x")
 
-        tf_popup_img_labels = {}
-        for i, tf in enumerate(["D1", "H4", "H1"]):
+        tf_popup_img_labels = [[None] * len(WHICH_IDX) for _ in TF_IDX]
+        for tf, i in TF_IDX.items():
             ttk.Label(tf_frame, text=tf, font=("Segoe UI", 10, "bold")).grid(row=i, column=0, padx=8, pady=6, sticky="e")
+            for which, j in WHICH_IDX.items():
+                img_lbl = ttk.Label(tf_frame, text="Loading..." if trade.tf_screenshots[tf][which] else NO_SCREENSHOT_TEXT[j],
+                                    cursor="hand2", foreground="blue")
+                img_lbl.grid(row=i, column=1 + 2 * j, padx=5)
+                ttk.Button(tf_frame, text=f"Attach/Edit {which.capitalize()}",
+                           command=functools.partial(self.edit_tf_img, trade, tf, which, img_lbl)).grid(row=i, column=2 + 2 * j, padx=2)
+                tf_popup_img_labels[i][j] = img_lbl
+
+        def _load_popup_thumbnails():
+            """Fills in the screenshot thumbnails once the popup has drawn, so decoding doesn't delay it."""
+            if not popup.winfo_exists():
+                return
+            for tf, i in TF_IDX.items():
+                for which, j in WHICH_IDX.items():
+                    img_lbl = tf_popup_img_labels[i][j]
+                    img_path = trade.tf_screenshots[tf][which]
+                    # get_thumb stats the file anyway, so a missing screenshot shows up as a failed thumbnail
+                    if img_path and self._show_img_thumbnail(img_path, img_lbl, size=(110,70)):
+                        img_lbl.bind("<Button-1>", functools.partial(self._on_screenshot_click, img_path, popup))
+                    else:
+                        img_lbl.configure(text=NO_SCREENSHOT_TEXT[j], image="")
+                        img_lbl.unbind("<Button-1>")
 
-            before_lbl = ttk.Label(tf_frame, text="No before screenshot", cursor="hand2", foreground="blue")
-            before_lbl.grid(row=i, column=1, padx=5)
-            img_path_before = trade.tf_screenshots[tf]["before"]
-            if img_path_before and os.path.exists(img_path_before):
-                self._show_img_thumbnail(img_path_before, before_lbl, size=(110,70))
-                before_lbl.bind("<Button-1>", lambda e, path=img_path_before: show_image_popup(path))
-            else:
-                before_lbl["text"] = "No before screenshot"
-                before_lbl.unbind("<Button-1>")
-            ttk.Button(tf_frame, text="Attach/Edit Before", command=lambda t=tf: self.edit_tf_img(trade, t, "before", before_lbl)).grid(row=i, column=2, padx=2)
-
-            after_lbl = ttk.Label(tf_frame, text="No after screenshot", cursor="hand2", foreground="blue")
-            after_lbl.grid(row=i, column=3, padx=5)
-            img_path_after = trade.tf_screenshots[tf]["after"]
-            if img_path_after and os.path.exists(img_path_after):
-                self._show_img_thumbnail(img_path_after, after_lbl, size=(110,70))
-                after_lbl.bind("<Button-1>", lambda e, path=img_path_after: show_image_popup(path))
-            else:
-                after_lbl["text"] = "No after screenshot"
-                after_lbl.unbind("<Button-1>")
-            ttk.Button(tf_frame, text="Attach/Edit After", command=lambda t=tf: self.edit_tf_img(trade, t, "after", after_lbl)).grid(row=i, column=4, padx=2)
-
-            tf_popup_img_labels[(tf, "before")] = before_lbl
-            tf_popup_img_labels[(tf, "after")] = after_lbl
+        popup.after_idle(_load_popup_thumbnails)
 
         def close_trade_update_balance():
+            self._flush_debounce((popup, "outcome")) # Close price must match an outcome picked just before closing
+            self._flush_debounce((popup, "mdd_price")) # Derive pips from a drawdown price typed just before closing
             review["outcome"] = outcome_var.get()
             review["price"] = close_price_var.get()
             review["notes"] = notes_text.get("1.0", "end").strip()
@@ -1466,20 +1997,17 @@ class TradingJournalApp(tk.Tk):
             review["max_drawdown_pips"] = max_drawdown_pips_var.get()
 
             trade.sl_to_be = sl_to_be_var.get()
+            self.invalidate_trade(idx)
 
-            final_pnl = 0.0
-
-            for pc in trade.partial_closes:
-                final_pnl += pc.get("pnl", 0.0)
+            final_pnl = trade.pc_pnl_sum # Running partial-close totals kept by Trade.add_partial_close
 
             try:
-                entry_price = float(info.get("entry_price", 0))
+                entry_price = nums["entry_price"]
                 close_price = float(review.get("price", 0))
-                original_lot_size = float(info.get("lot_size", 0))
+                original_lot_size = nums["lot_size"]
                 trade_type = info.get("trade_type", "Buy")
 
-                closed_lot_size_partials = sum(pc.get("amount", 0) for pc in trade.partial_closes)
-                remaining_lot_size = original_lot_size - closed_lot_size_partials
+                remaining_lot_size = original_lot_size - trade.pc_amount_sum
 
                 if remaining_lot_size > 0:
                     if trade_type == "Buy":
@@ -1496,7 +2024,7 @@ class TradingJournalApp(tk.Tk):
             self.account_balance_var.set(self.account_balance_var.get() + final_pnl)
 
             self.save_trades()
-            self.refresh_trades_tree()
+            self._update_trade_row(idx)
             self.update_stats_bar()
             popup.destroy()
 
@@ -1504,13 +2032,20 @@ class TradingJournalApp(tk.Tk):
         ttk.Button(frame, text="Cancel", command=popup.destroy).pack(pady=2)
 
     def refresh_partial_tree(self, treeview, trade):
-        for i in treeview.get_children():
-            treeview.delete(i)
-
-        for pc_idx, pc in enumerate(trade.partial_closes):
-            partial_pnl_formatted = f"${pc.get('pnl', 0.0):,.2f}"
+        """Inserts the partial closes not yet listed; rows are keyed by their index in trade.partial_closes."""
+        # Partial closes are only ever appended, so rows already shown never change
+        partial_closes = trade.partial_closes
+        children = treeview.get_children()
+        shown = len(children)
+        if shown > len(partial_closes): # Not this trade's rows; start over
+            treeview.delete(*children)
+            shown = 0
+
+        for pc_idx in range(shown, len(partial_closes)):
+            pc = partial_closes[pc_idx]
+            partial_pnl_formatted = _fmt_usd(pc.get("pnl", 0.0))
             treeview.insert(
-                "", "end",
+                "", "end", iid=pc_idx,
                 values=(
                     pc.get("timestamp", ""),
                     pc.get("amount", 0.0),
@@ -1523,40 +2058,89 @@ class TradingJournalApp(tk.Tk):
 
     def edit_tf_img(self, trade, tf, when, lbl):
         path = filedialog.askopenfilename(filetypes=[("Images", "*.png;*.jpg;*.jpeg;*.bmp;*.gif")])
+        if path:
+            path = self.import_screenshot(path, tf, when)
         if path:
             trade.tf_screenshots[tf][when] = path
             self._show_img_thumbnail(path, lbl, size=(110,70))
-            lbl.bind("<Button-1>", lambda e, path=path: self.show_image_popup_from_review(path))
+            lbl.bind("<Button-1>", functools.partial(self._on_screenshot_click, path, None))
             self.save_trades()
         else:
             lbl["text"] = f"No {when} screenshot"
             lbl["image"] = ""
             lbl.unbind("<Button-1>")
 
+    def get_thumb(self, path, size):
+        """Returns a PhotoImage thumbnail for `path`, skipping the full decode when a cached one is current."""
+        st = os.stat(path)
+        key = f"{_thumb_path_hash(path)}_{st.st_mtime_ns}_{st.st_size}_{size[0]}x{size[1]}"
+        photo = self._thumb_cache.get(key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(key)
+            return photo
+
+        cache_path = os.path.join(THUMB_CACHE_DIR, key + ".png")
+        if os.path.exists(cache_path):
+            img = Image.open(cache_path)
+        else:
+            with open(path, "rb", buffering=IMAGE_READ_BUFFER) as fp:
+                img = Image.open(fp)
+                img.draft("RGB", size) # Lets libjpeg decode at a reduced scale; no-op for other formats
+                img.thumbnail(size)
+            try:
+                os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+                img.save(cache_path, "PNG", optimize=True)
+            except (OSError, ValueError):
+                pass # The disk cache is best-effort; the thumbnail is still shown
+        photo = ImageTk.PhotoImage(img)
+        self._thumb_cache[key] = photo
+        if len(self._thumb_cache) > THUMB_MEMORY_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False) # Labels still showing it hold their own reference
+        return photo
+
+    def _prune_thumb_cache(self, trades):
+        """Deletes cached thumbnails whose screenshot no trade in `trades` references any more."""
+        keep = {_thumb_path_hash(path) for trade in trades
+                for shots in trade.tf_screenshots.values() for path in shots.values() if path}
+        try:
+            with os.scandir(THUMB_CACHE_DIR) as entries:
+                stale = [entry.path for entry in entries if entry.name.partition("_")[0] not in keep]
+            for cache_path in stale:
+                os.remove(cache_path)
+        except OSError:
+            pass # Like writing it, pruning the disk cache is best-effort
+
     def _show_img_thumbnail(self, path, label, size=(80, 50)):
+        """Shows the thumbnail of `path` on `label`; returns False (label shows "(missing)") if it can't be read."""
         try:
-            img = Image.open(path)
-            img.thumbnail(size)
-            img = ImageTk.PhotoImage(img)
+            img = self.get_thumb(path, size)
             label.image = img
             label.configure(image=img, text="")
+            return True
         except Exception:
             label.configure(text="(missing)", image="")
+            return False
+
+    def _on_screenshot_click(self, img_path, parent, event):
+        """<Button-1> handler for screenshot thumbnails; bound with functools.partial instead of a lambda per label."""
+        self.show_image_popup_from_review(img_path, parent)
 
-    def show_image_popup_from_review(self, img_path):
+    def show_image_popup_from_review(self, img_path, parent=None):
+        """Opens a preview window; with a `parent` popup it stays on top of it and grabs input."""
         try:
-            img = Image.Image.open(img_path)
-            popup_img = tk.Toplevel()
+            img = Image.open(img_path)
+            popup_img = tk.Toplevel(parent) if parent is not None else tk.Toplevel()
             popup_img.title("Screenshot Preview")
             max_w, max_h = 1200, 900
-            w, h = img.size
-            scale = min(1, max_w / w, max_h / h)
-            if scale < 1:
-                img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+            img.draft("RGB", (max_w, max_h))
+            img.thumbnail((max_w, max_h), Image.LANCZOS) # In place; only ever shrinks
             tkimg = ImageTk.PhotoImage(img)
             lbl = tk.Label(popup_img, image=tkimg)
             lbl.image = tkimg
             lbl.pack()
+            if parent is not None:
+                popup_img.transient(parent)
+                popup_img.grab_set()
             popup_img.focus_force()
         except Exception as e:
             messagebox.showerror("Image Error", f"Could not open image:\n{e}")
@@ -1572,38 +2156,13 @@ class TradingJournalApp(tk.Tk):
         self.sync_all_sl_tp()
 
     def _update_trade_type_buttons(self):
-        buy_color_active = "#2ecc40"
-        sell_color_active = "#ff4136"
-        text_color_active = "#fff"
-        default_bg = "#e0e0e0"
-        default_fg = "#333"
-
-        if self.trade_type_var.get() == "Buy":
-            self.buy_btn.configure(
-                bg=buy_color_active, fg=text_color_active,
-                activebackground=buy_color_active, activeforeground=text_color_active,
-                relief="solid", bd=1, highlightthickness=0,
-                font=("Segoe UI", 11, "bold"), cursor="hand2"
-            )
-            self.sell_btn.configure(
-                bg=default_bg, fg=default_fg,
-                activebackground=default_bg, activeforeground=default_fg,
-                relief="solid", bd=1, highlightthickness=0,
-                font=("Segoe UI", 11), cursor="hand2"
-            )
-        else:
-            self.sell_btn.configure(
-                bg=sell_color_active, fg=text_color_active,
-                activebackground=sell_color_active, activeforeground=text_color_active,
-                relief="solid", bd=1, highlightthickness=0,
-                font=("Segoe UI", 11, "bold"), cursor="hand2"
-            )
-            self.buy_btn.configure(
-                bg=default_bg, fg=default_fg,
-                activebackground=default_bg, activeforeground=default_fg,
-                relief="solid", bd=1, highlightthickness=0,
-                font=("Segoe UI", 11), cursor="hand2"
-            )
+        trade_type = self.trade_type_var.get()
+        if trade_type == self._trade_type_shown: # Re-click on the active direction
+            return
+        self._trade_type_shown = trade_type
+        is_buy = trade_type == "Buy"
+        self.buy_btn.configure(**(self._ACTIVE_BUY if is_buy else self._IDLE))
+        self.sell_btn.configure(**(self._IDLE if is_buy else self._ACTIVE_SELL))
 
     def update_balance_popup(self):
         popup = tk.Toplevel(self)
@@ -1617,7 +2176,6 @@ class TradingJournalApp(tk.Tk):
         entry = ttk.Entry(popup, textvariable=new_bal_var, width=18)
         entry.pack(pady=4)
         entry.focus_set()
-        self._on_focus_select_all(entry, new_bal_var)
 
         def update_and_close():
             try:
@@ -1633,19 +2191,19 @@ class TradingJournalApp(tk.Tk):
         self._sl_tp_is_updating = True
         try:
             entry = self.entry_price_var.get()
-            pips = self.sl_pips_var.get()
+            pips = float(self.sl_pips_var.get())
 
             if self.trade_type_var.get() == "Buy":
                 price = entry - (pips * PIP_VALUE_XAUUSD)
             else:
                 price = entry + (pips * PIP_VALUE_XAUUSD)
 
-            if abs(self.sl_price_var.get() - price) > 1e-6:
+            if _differs(self.sl_price_var.get(), price):
                 self.sl_price_var.set(round(price, 2))
         except (ValueError, tk.TclError):
             pass
         finally:
-            self.update_sl_loss()
+            self._refresh_risk()
             self._sl_tp_is_updating = False
 
     def update_sl_from_price(self):
@@ -1653,19 +2211,19 @@ class TradingJournalApp(tk.Tk):
         self._sl_tp_is_updating = True
         try:
             entry = self.entry_price_var.get()
-            price = self.sl_price_var.get()
+            price = float(self.sl_price_var.get())
 
             if self.trade_type_var.get() == "Buy":
                 pips = round((entry - price) / PIP_VALUE_XAUUSD, 1)
             else:
                 pips = round((price - entry) / PIP_VALUE_XAUUSD, 1)
 
-            if abs(self.sl_pips_var.get() - pips) > 1e-6:
+            if _differs(self.sl_pips_var.get(), pips):
                 self.sl_pips_var.set(pips)
         except (ValueError, tk.TclError):
             pass
         finally:
-            self.update_sl_loss()
+            self._refresh_risk()
             self._sl_tp_is_updating = False
 
     def update_tp_from_pips(self):
@@ -1673,19 +2231,19 @@ class TradingJournalApp(tk.Tk):
         self._sl_tp_is_updating = True
         try:
             entry = self.entry_price_var.get()
-            pips = self.tp_pips_var.get()
+            pips = float(self.tp_pips_var.get())
 
             if self.trade_type_var.get() == "Buy":
                 price = entry + (pips * PIP_VALUE_XAUUSD)
             else:
                 price = entry - (pips * PIP_VALUE_XAUUSD)
 
-            if abs(self.tp_price_var.get() - price) > 1e-6:
+            if _differs(self.tp_price_var.get(), price):
                 self.tp_price_var.set(round(price, 2))
         except (ValueError, tk.TclError):
             pass
         finally:
-            self.update_tp_profit()
+            self._refresh_risk()
             self._sl_tp_is_updating = False
 
     def update_tp_from_price(self):
@@ -1693,72 +2251,66 @@ class TradingJournalApp(tk.Tk):
         self._sl_tp_is_updating = True
         try:
             entry = self.entry_price_var.get()
-            price = self.tp_price_var.get()
+            price = float(self.tp_price_var.get())
 
             if self.trade_type_var.get() == "Buy":
                 pips = round((price - entry) / PIP_VALUE_XAUUSD, 1)
             else:
                 pips = round((entry - price) / PIP_VALUE_XAUUSD, 1)
 
-            if abs(self.tp_pips_var.get() - pips) > 1e-6:
+            if _differs(self.tp_pips_var.get(), pips):
                 self.tp_pips_var.set(pips)
         except (ValueError, tk.TclError):
             pass
         finally:
-            self.update_tp_profit()
+            self._refresh_risk()
             self._sl_tp_is_updating = False
 
-    def update_sl_loss(self):
-        try:
-            lot = float(self.lot_size_var.get())
-            pips = abs(float(self.sl_pips_var.get()))
-            loss = -lot * pips * USD_PER_PIP_PER_LOT
-            self.sl_loss_var.set("${:,.0f}".format(loss))
-            balance = float(self.account_balance_var.get())
-            loss_pct = (abs(loss) / balance) * 100 if balance > 0 else 0
-            self.sl_loss_pct_var.set("({:.2f}%)".format(loss_pct))
-        except (ValueError, tk.TclError):
-            self.sl_loss_var.set("")
-            self.sl_loss_pct_var.set("")
-        except Exception:
-            pass
-
-    def update_tp_profit(self):
+    def _refresh_risk(self, bal=None):
+        """Update the SL loss and TP profit labels from one balance read."""
+        if self._risk_deferred:
+            return
         try:
-            lot = float(self.lot_size_var.get())
-            pips = abs(float(self.tp_pips_var.get()))
-            profit = lot * pips * USD_PER_PIP_PER_LOT
-            self.tp_profit_var.set("${:,.0f}".format(profit))
-            balance = float(self.account_balance_var.get())
-            profit_pct = (profit / balance) * 100 if balance > 0 else 0
-            self.tp_profit_pct_var.set("({:.2f}%)".format(profit_pct))
-        except (ValueError, tk.TclError):
-            self.tp_profit_var.set("")
-            self.tp_profit_pct_var.set("")
-        except Exception:
-            pass
+            lot = self.lot_size_var.get()
+            if bal is None:
+                bal = self.account_balance_var.get()
+        except tk.TclError:
+            lot = bal = None
+        for pips_var, sign, usd_var, pct_var in (
+                (self.sl_pips_var, -1, self.sl_loss_var, self.sl_loss_pct_var),
+                (self.tp_pips_var, 1, self.tp_profit_var, self.tp_profit_pct_var)):
+            try:
+                if lot is None:
+                    raise ValueError
+                amount = sign * lot * abs(float(pips_var.get())) * USD_PER_PIP_PER_LOT
+                usd_var.set("${:,.0f}".format(amount))
+                pct = (abs(amount) / bal) * 100 if bal > 0 else 0
+                pct_var.set("({:.2f}%)".format(pct))
+            except (ValueError, tk.TclError):
+                usd_var.set("")
+                pct_var.set("")
 
     def sync_all_sl_tp(self):
-        self.update_sl_from_pips()
-        self.update_tp_from_pips()
+        # Hold the risk labels until both sides are synced, then refresh once
+        self._risk_deferred = True
+        try:
+            self.update_sl_from_pips()
+            self.update_tp_from_pips()
+        finally:
+            self._risk_deferred = False
+        self._refresh_risk()
 
     def update_market_session(self, *args):
         try:
             self.timezone_display_var.set(self.timezone_var.get())
-            tz = pytz.timezone(self.timezone_var.get())
+            tz = _get_tz(self.timezone_var.get())
         except Exception:
-            tz = pytz.UTC
+            tz = UTC
 
         try:
-            date_str = self.trade_date_var.get()
-            time_str = self.trade_time_var.get()
-            if len(time_str.split(":")) == 1:
-                time_str += ":00"
-
-            local_dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            local_dt = _parse_date_time(self.trade_date_var.get(), self.trade_time_var.get())
             local_dt = tz.localize(local_dt)
-            utc_dt = local_dt.astimezone(pytz.UTC)
-            utc_time = utc_dt.time()
+            utc_dt = local_dt.astimezone(UTC)
         except ValueError:
             self.market_session_var.set("Invalid Date/Time")
             return
@@ -1766,30 +2318,7 @@ class TradingJournalApp(tk.Tk):
             self.market_session_var.set("")
             return
 
-        active_sessions = []
-        overlaps = []
-        for i, (name, start, end) in enumerate(MARKET_SESSIONS_UTC):
-            if start < end:
-                is_open = start <= utc_time < end
-            else:
-                is_open = utc_time >= start or utc_time < end
-            if is_open:
-                active_sessions.append(name)
-
-        if len(active_sessions) > 1:
-            for j in range(len(active_sessions)):
-                for k in range(j + 1, len(active_sessions)):
-                    overlaps.append(f"{active_sessions[j]}+{active_sessions[k]}")
-
-        session_str = ""
-        if overlaps:
-            session_str = " / ".join(overlaps)
-        elif active_sessions:
-            session_str = " / ".join(active_sessions)
-        else:
-            session_str = "Closed"
-
-        self.market_session_var.set(session_str)
+        self.market_session_var.set(SESSION_LABELS[SESSION_MASK_AT_MINUTE[utc_dt.hour * 60 + utc_dt.minute]])
 
 if __name__ == "__main__":
     app = TradingJournalApp()
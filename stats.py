@@ -1,8 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
+import os
+import json
+from array import array
+from collections import OrderedDict
+from itertools import compress
+from operator import itemgetter
+
+FILTER_DEBOUNCE_MS = 150 # Quiet time after a filter change before the table is refiltered
+FILTER_CACHE_SIZE = 64 # Filter combinations whose mask and stats are kept for reuse
+TABLE_ROW_CHUNK = 200 # Table rows are inserted this many at a time as the table is scrolled toward its end
+SUMMED_FIELDS = ("P&L", "R:R", "Hold Time") # Columns totalled by filter_and_stats, in its stats order
+MOCK_DATA_FILE = "stats_mock_data.bin" # Saved mock columns, reused on later launches
+# Fields of the category columns and of all columns create_mock_data produces; a saved file must match
+CATEGORY_FIELDS = ("Setup", "Entry Type", "Market Session", "Stop Loss Reason", "Reason for Close", "Take Profit Reason")
+MOCK_COLUMNS = frozenset(("ID", "Stop Loss Size", "P&L", "R:R", "Win", "Hold Time") + CATEGORY_FIELDS)
 
 def create_mock_data(num_trades=50):
+    """Generates random trades as one column per field, plus the sorted values of each category field.
+
+    Category columns hold one byte per trade: the index of its value in that field's vocab list."""
     setups = ["Breakout", "Retest", "Trend Continuation", "Reversal", "Scalp"]
     entry_types = ["Limit", "Market"]
     market_sessions = ["New York", "London", "Asia"]
@@ -10,38 +28,176 @@ def create_mock_data(num_trades=50):
     close_reasons = ["Take Profit", "Manual Close (Profit)", "Hit SL", "Manual Close (Loss)"]
     tp_reasons = ["Target Hit", "Manual Close (TP)"]
 
-    data = []
-    for i in range(1, num_trades + 1):
-        win = random.choice([True, False])
-        pnl = round(random.uniform(50, 500) if win else random.uniform(-500, -50), 2)
-        r_multiple = round(random.uniform(1, 5) if win else random.uniform(-0.5, -2), 2)
-        hold_time = random.randint(15, 240)
-
-        trade = {
-            "ID": i,
-            "Setup": random.choice(setups),
-            "Entry Type": random.choice(entry_types),
-            "Market Session": random.choice(market_sessions),
-            "Stop Loss Reason": random.choice(sl_reasons) if not win else "N/A",
-            "Reason for Close": random.choice(close_reasons),
-            "Take Profit Reason": random.choice(tp_reasons) if win else "N/A",
-            "Stop Loss Size": random.uniform(0.5, 2.0),
-            "P&L": pnl,
-            "R:R": r_multiple,
-            "Win": win,
-            "Hold Time": hold_time
-        }
-        data.append(trade)
-    return data
+    vocab = {
+        "Setup": sorted(setups),
+        "Entry Type": sorted(entry_types),
+        "Market Session": sorted(market_sessions),
+        "Stop Loss Reason": sorted(sl_reasons + ["N/A"]),
+        "Reason for Close": sorted(close_reasons),
+        "Take Profit Reason": sorted(tp_reasons + ["N/A"]),
+    }
+    n = num_trades
+    rand = random.random
+
+    def pick(name, values):
+        """A uniformly random code per trade among `values` of field `name`."""
+        code = {value: i for i, value in enumerate(vocab[name])}
+        return bytes(random.choices([code[value] for value in values], k=n))
+
+    win = bytes(random.choices((0, 1), k=n))
+    sl_na, tp_na = vocab["Stop Loss Reason"].index("N/A"), vocab["Take Profit Reason"].index("N/A")
+    cols = {
+        "ID": array("i", range(1, n + 1)),
+        "Setup": pick("Setup", setups),
+        "Entry Type": pick("Entry Type", entry_types),
+        "Market Session": pick("Market Session", market_sessions),
+        # Winners have no stop loss reason and losers no take profit reason
+        "Stop Loss Reason": bytes(sl_na if w else c for w, c in zip(win, pick("Stop Loss Reason", sl_reasons))),
+        "Reason for Close": pick("Reason for Close", close_reasons),
+        "Take Profit Reason": bytes(c if w else tp_na for w, c in zip(win, pick("Take Profit Reason", tp_reasons))),
+        "Stop Loss Size": array("d", [0.5 + 1.5 * rand() for _ in range(n)]),
+        # Winners: P&L in [50, 500], R:R in [1, 5]; losers: P&L in [-500, -50], R:R in [-2, -0.5]
+        "P&L": array("d", [round((50 + 450 * rand()) if w else (-500 + 450 * rand()), 2) for w in win]),
+        "R:R": array("d", [round((1 + 4 * rand()) if w else (-2 + 1.5 * rand()), 2) for w in win]),
+        "Win": win,
+        "Hold Time": array("i", random.choices(range(15, 241), k=n)),
+    }
+    return cols, vocab
+
+def save_columns(path, cols, vocab):
+    """Writes the columns to `path`: a JSON header line, then each column's raw bytes back to back."""
+    header = {"vocab": vocab, "columns": [
+        [name, col.typecode, col.itemsize] if isinstance(col, array) else [name, None, 1] for name, col in cols.items()
+    ]}
+    data = json.dumps(header).encode("utf-8") + b"\n" + b"".join(map(bytes, cols.values()))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path) # Never leaves a half-written file behind
+
+def load_columns(path):
+    """Reads columns written by save_columns; returns None if the file is missing or unusable."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        header_end = data.index(b"\n")
+        header = json.loads(data[:header_end])
+        view = memoryview(data)[header_end + 1:]
+        n = len(view) // sum(itemsize for _, _, itemsize in header["columns"])
+        cols, offset = {}, 0
+        for name, typecode, itemsize in header["columns"]:
+            chunk = view[offset:offset + n * itemsize]
+            offset += n * itemsize
+            if typecode is None:
+                cols[name] = bytes(chunk)
+            else:
+                cols[name] = array(typecode)
+                if cols[name].itemsize != itemsize: # Written on a platform with other C type sizes
+                    return None
+                cols[name].frombytes(chunk)
+        if offset != len(view):
+            return None
+        vocab = header["vocab"]
+        # A file from an earlier layout parses fine but would fail once the page reads its columns
+        if cols.keys() != MOCK_COLUMNS or vocab.keys() != set(CATEGORY_FIELDS):
+            return None
+        if any(not isinstance(cols[name], bytes) or max(cols[name], default=0) >= len(vocab[name])
+               for name in CATEGORY_FIELDS):
+            return None
+        return cols, vocab
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, ZeroDivisionError):
+        return None
+
+def load_mock_data(path=MOCK_DATA_FILE):
+    """Returns the saved mock columns and vocab, generating and saving them on first use."""
+    loaded = load_columns(path)
+    if loaded is not None:
+        return loaded
+    cols, vocab = create_mock_data()
+    try:
+        save_columns(path, cols, vocab)
+    except OSError:
+        pass # Read-only directory: just regenerate next time
+    return cols, vocab
+
+_BIT_CHARS = bytes.maketrans(b"\x00\x01", b"01") # 0/1 flag bytes -> ASCII binary digits
+_FLAG_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+def pack_flags(flags):
+    """Packs a 0/1 byte per trade into an int with bit i set when flags[i] is 1."""
+    return int(flags.translate(_BIT_CHARS)[::-1] or b"0", 2)
+
+def unpack_flags(bits, n):
+    """Inverse of pack_flags for `n` trades."""
+    return format(bits, f"0{n}b")[::-1][:n].encode("ascii").translate(_FLAG_BYTES)
+
+def _match_table(code):
+    """bytes.translate table mapping `code` to 1 and every other byte to 0."""
+    table = bytearray(256)
+    table[code] = 1
+    return bytes(table)
 
-class StatsPage(tk.Tk):
-    def __init__(self):
-        super().__init__()
+def filter_and_stats(cols, n, codes, min_sl_size=None, win_bits=None):
+    """Returns the 0/1 mask of the trades whose category codes match `codes` ({field: code}) and whose
+    stop loss is at least `min_sl_size` (None for no limit), with their (count, wins, P&L, R:R, hold time) sums.
+
+    `win_bits` is pack_flags(cols["Win"]), if the caller keeps it. Category filters are applied in
+    the order of `codes`, so callers should list the most selective first."""
+    # Each predicate is packed to one bit per trade, so one & combines whole masks at once
+    bits = (1 << n) - 1
+    for field, code in codes.items():
+        bits &= pack_flags(cols[field].translate(_match_table(code)))
+        if not bits:
+            break # Nothing left for later filters to reject
+    mask = unpack_flags(bits, n)
+    if min_sl_size is not None and bits:
+        # The only per-trade Python check, so it runs last and only over the trades still selected
+        sl_sizes = cols["Stop Loss Size"]
+        mask = bytearray(mask)
+        for i in compress(range(n), mask):
+            if sl_sizes[i] < min_sl_size:
+                mask[i] = 0
+        mask = bytes(mask)
+        bits = pack_flags(mask)
+    if win_bits is None:
+        win_bits = pack_flags(cols["Win"])
+    count = bits.bit_count()
+    # One C-level sum per column beats a single interpreted loop doing all three; whole or empty
+    # selections (no filters, or nothing matching) don't need compress at all
+    if count == n:
+        sums = tuple(sum(cols[field]) for field in SUMMED_FIELDS)
+    elif count == 0:
+        sums = (0,) * len(SUMMED_FIELDS)
+    else:
+        sums = tuple(sum(compress(cols[field], mask)) for field in SUMMED_FIELDS)
+    return mask, (count, (bits & win_bits).bit_count()) + sums
+
+def _row_getter(rows):
+    """Returns a function taking the values at `rows` out of a column as a tuple, in one C-level call."""
+    if len(rows) > 1:
+        return itemgetter(*rows)
+    return lambda col: tuple(col[i] for i in rows) # itemgetter needs 2+ indices to return a tuple
+
+class StatsPage(tk.Toplevel):
+    """The stats page as a window of an existing Tk root, so opening it doesn't start another Tcl interpreter."""
+    def __init__(self, master=None):
+        super().__init__(master)
         self.title("Playbook Stats Page")
         self.geometry("1200x800")
-        self.protocol("WM_DELETE_WINDOW", self.quit)
-        self.data = create_mock_data()
-        self.filtered_data = self.data[:]
+        self.cols, self.vocab = load_mock_data()
+        self.n = len(self.cols["ID"])
+        self.win_bits = pack_flags(self.cols["Win"]) # Bit i set when trade i won; win counts are popcounts
+        self.code = {name: {value: i for i, value in enumerate(values)} for name, values in self.vocab.items()}
+        self.mask = b"\x01" * self.n # 1 for each trade passing the current filters
+        self._pending_filter = None # after() id of a scheduled apply_filters
+        # (codes, min SL size) -> (mask, stats), least recently used first; clear it if self.cols changes
+        self._filter_cache = OrderedDict()
+        self.sort_by = None # Table column the rows are sorted on, None for trade order
+        self.sort_reverse = False
+        self._sort_orders = {} # Column -> all row indices in ascending order of that column
+        self._table_order = [] # Indices of the trades the table lists, in display order
+        self._table_rows = 0 # How many of them are inserted so far; always a prefix of _table_order
+        self._pending_rows = None # after_idle id of a queued _insert_more_table_rows
         self.create_widgets()
         self.apply_filters()
 
@@ -49,31 +205,30 @@ class StatsPage(tk.Tk):
         filter_frame = ttk.LabelFrame(self, text="Smart Filter Panel", padding="10")
         filter_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
 
-        filter_options = {
-            "Setup": sorted(list(set(d["Setup"] for d in self.data))),
-            "Entry Type": sorted(list(set(d["Entry Type"] for d in self.data))),
-            "Market Session": sorted(list(set(d["Market Session"] for d in self.data))),
-            "Stop Loss Reason": sorted(list(set(d["Stop Loss Reason"] for d in self.data))),
-            "Reason for Close": sorted(list(set(d["Reason for Close"] for d in self.data))),
-            "Take Profit Reason": sorted(list(set(d["Take Profit Reason"] for d in self.data))),
-        }
+        label_grid = dict(sticky=tk.W, padx=5, pady=2) # Shared grid options of the label/value cells
+        field_grid = dict(sticky=tk.EW, padx=5, pady=2)
 
         self.filter_vars = {}
+        self._category_filters = [] # (field, combobox, value -> code), most selective field first
         row = col = 0
-        for label_text, options in filter_options.items():
-            ttk.Label(filter_frame, text=f"{label_text}:").grid(row=row, column=col, sticky=tk.W, padx=5, pady=2)
+        for label_text, options in self.vocab.items(): # Sorted values per field, from create_mock_data
+            ttk.Label(filter_frame, text=f"{label_text}:").grid(row=row, column=col, **label_grid)
             var = ttk.Combobox(filter_frame, values=["ANY"] + options, state="readonly")
             var.set("ANY")
-            var.grid(row=row, column=col+1, sticky=tk.EW, padx=5, pady=2)
+            var.bind("<<ComboboxSelected>>", self._schedule_filters)
+            var.grid(row=row, column=col+1, **field_grid)
             self.filter_vars[label_text] = var
+            self._category_filters.append((label_text, var, self.code[label_text]))
             col += 2
             if col >= 6:
                 row += 1
                 col = 0
+        # A field with more values keeps fewer trades per value, so check it first
+        self._category_filters.sort(key=lambda category_filter: len(category_filter[2]), reverse=True)
 
-        ttk.Label(filter_frame, text="Min SL Size (%):").grid(row=row, column=col, sticky=tk.W, padx=5, pady=2)
+        ttk.Label(filter_frame, text="Min SL Size (%):").grid(row=row, column=col, **label_grid)
         self.filter_vars["Stop Loss Size"] = ttk.Entry(filter_frame, width=10)
-        self.filter_vars["Stop Loss Size"].grid(row=row, column=col+1, sticky=tk.EW, padx=5, pady=2)
+        self.filter_vars["Stop Loss Size"].grid(row=row, column=col+1, **field_grid)
         ttk.Button(filter_frame, text="Apply Filters", command=self.apply_filters).grid(row=row, column=col+2, padx=10, pady=5)
 
         stats_frame = ttk.LabelFrame(self, text="Stats Overview (After Filtering)", padding="10")
@@ -85,12 +240,13 @@ class StatsPage(tk.Tk):
             "Avg. Hold Time": "0 min"
         }
         for i, (label_text, default_value) in enumerate(stats_data.items()):
-            ttk.Label(stats_frame, text=f"{label_text}:").grid(row=0 if i < 3 else 1, column=i%3*2, sticky=tk.W, padx=5, pady=2)
+            row, col = divmod(i, 3)
+            ttk.Label(stats_frame, text=f"{label_text}:").grid(row=row, column=col*2, **label_grid)
             label = ttk.Label(stats_frame, text=default_value, font=('Arial', 10, 'bold'))
-            label.grid(row=0 if i < 3 else 1, column=i%3*2+1, sticky=tk.W, padx=5, pady=2)
+            label.grid(row=row, column=col*2+1, **label_grid)
             self.stats_labels[label_text] = label
 
-        ttk.Label(stats_frame, text="Win Rate Visual:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        ttk.Label(stats_frame, text="Win Rate Visual:").grid(row=2, column=0, **label_grid)
         self.win_rate_canvas = tk.Canvas(stats_frame, width=200, height=20, bg="lightgray", highlightbackground="gray")
         self.win_rate_canvas.grid(row=2, column=1, columnspan=5, sticky=tk.W, padx=5, pady=5)
         self.win_rate_bar = self.win_rate_canvas.create_rectangle(0, 0, 0, 20, fill="red", outline="")
@@ -98,55 +254,68 @@ class StatsPage(tk.Tk):
 
         table_frame = ttk.LabelFrame(self, text="Trades Table", padding="10")
         table_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        columns = ("ID", "Setup", "Entry Type", "P&L", "R:R", "Win", "Hold Time")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="browse")
-        for col in columns:
+        column_widths = {"ID": 40, "Setup": 120, "Entry Type": 80, "P&L": 90, "R:R": 60, "Win": 50, "Hold Time": 80}
+        self.tree = ttk.Treeview(table_frame, columns=tuple(column_widths), show="headings", selectmode="browse")
+        for col, width in column_widths.items():
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_column(c))
-            self.tree.column(col, width=100, anchor=tk.CENTER)
-        self.tree.column("ID", width=40)
-        self.tree.column("Setup", width=120)
-        self.tree.column("Entry Type", width=80)
-        self.tree.column("P&L", width=90)
-        self.tree.column("R:R", width=60)
-        self.tree.column("Win", width=50)
-        self.tree.column("Hold Time", width=80)
+            self.tree.column(col, width=width, anchor=tk.CENTER) # One configure per column
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill="y")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self._table_vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self._table_vsb.pack(side=tk.RIGHT, fill="y")
+        self.tree.configure(yscrollcommand=self._on_table_yview)
         self.tree.bind("<Double-1>", self.on_trade_select)
         self.tree.bind("<Return>", self.on_trade_select)
 
+    def destroy(self):
+        if self._pending_filter is not None: # Don't refilter a closed page
+            self.after_cancel(self._pending_filter)
+            self._pending_filter = None
+        if self._pending_rows is not None: # Nor insert rows into its destroyed table
+            self.after_cancel(self._pending_rows)
+            self._pending_rows = None
+        super().destroy()
+
+    def _schedule_filters(self, *_):
+        """Refilters once the filter selections stop changing for FILTER_DEBOUNCE_MS."""
+        if self._pending_filter is not None:
+            self.after_cancel(self._pending_filter)
+        self._pending_filter = self.after(FILTER_DEBOUNCE_MS, self.apply_filters)
+
     def apply_filters(self):
-        current_filters = {key: var.get() for key, var in self.filter_vars.items()}
-        self.filtered_data = []
-        for trade in self.data:
-            match = True
-            for filter_name, filter_value in current_filters.items():
-                if filter_name == "Stop Loss Size":
-                    try:
-                        min_sl_size = float(filter_value)
-                        if trade["Stop Loss Size"] < min_sl_size:
-                            match = False
-                            break
-                    except ValueError:
-                        pass
-                else:
-                    if filter_value != "ANY" and trade[filter_name] != filter_value:
-                        match = False
-                        break
-            if match:
-                self.filtered_data.append(trade)
+        if self._pending_filter is not None: # Applied now, so drop a scheduled run
+            self.after_cancel(self._pending_filter)
+            self._pending_filter = None
+        codes = {} # Only the filters set to something other than ANY
+        for filter_name, combo, code in self._category_filters:
+            filter_value = combo.get()
+            if filter_value != "ANY":
+                codes[filter_name] = code[filter_value]
+        min_sl_size = None
+        min_sl_text = self.filter_vars["Stop Loss Size"].get().strip()
+        if min_sl_text: # Usually left blank; only typed text needs parsing
+            try:
+                min_sl_size = float(min_sl_text)
+            except ValueError:
+                pass
+            if min_sl_size != min_sl_size: # "nan" would reject every trade; ignore it like other bad input
+                min_sl_size = None
+        key = (tuple(codes.items()), min_sl_size) # Filters are always visited in the same order
+        result = self._filter_cache.get(key)
+        if result is None:
+            result = self._filter_cache[key] = filter_and_stats(self.cols, self.n, codes, min_sl_size, self.win_bits)
+            if len(self._filter_cache) > FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
+        else:
+            self._filter_cache.move_to_end(key)
+        self.mask, self.stats = result
         self.update_stats_and_table()
 
     def update_stats_and_table(self):
-        total_trades = len(self.filtered_data)
-        wins = sum(1 for trade in self.filtered_data if trade["Win"])
+        total_trades, wins, total_pnl, rr_sum, hold_sum = self.stats
         losses = total_trades - wins
         win_rate = (wins / total_trades * 100) if total_trades > 0 else 0.0
-        total_pnl = sum(trade["P&L"] for trade in self.filtered_data)
-        avg_rr = sum(trade["R:R"] for trade in self.filtered_data) / total_trades if total_trades > 0 else 0.0
-        avg_hold_time = sum(trade["Hold Time"] for trade in self.filtered_data) / total_trades if total_trades > 0 else 0.0
+        avg_rr = rr_sum / total_trades if total_trades > 0 else 0.0
+        avg_hold_time = hold_sum / total_trades if total_trades > 0 else 0.0
 
         self.stats_labels["Total Trades"].config(text=str(total_trades))
         self.stats_labels["Win Rate %"].config(text=f"{win_rate:.1f}%")
@@ -166,14 +335,63 @@ class StatsPage(tk.Tk):
         self.win_rate_canvas.itemconfig(self.win_rate_text, text=f"{win_rate:.1f}%")
         self.win_rate_canvas.coords(self.win_rate_text, bar_width / 2, 10)
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for trade in self.filtered_data:
-            self.tree.insert("", "end", values=(
-                trade["ID"], trade["Setup"], trade["Entry Type"],
-                f"${trade['P&L']:.2f}", f"{trade['R:R']:.2f}",
-                "✅" if trade["Win"] else "❌", f"{trade['Hold Time']} min"
-            ))
+        self.fill_table()
+
+    def _row_order(self):
+        """Returns the indices of the filtered trades in display order."""
+        mask = self.mask
+        if self.sort_by is None:
+            return list(compress(range(self.n), mask))
+        order = self._sort_orders.get(self.sort_by)
+        if order is None:
+            # Category codes index sorted vocab lists, so code order is alphabetical order
+            order = self._sort_orders[self.sort_by] = sorted(range(self.n), key=self.cols[self.sort_by].__getitem__)
+        return [i for i in (reversed(order) if self.sort_reverse else order) if mask[i]]
+
+    def _format_rows(self, rows):
+        """Returns the table values of trades `rows`, in that order."""
+        cols = self.cols
+        take = _row_getter(rows)
+        # Format the table a column at a time over the displayed trades, then zip the columns into rows
+        values = zip(
+            take(cols["ID"]),
+            map(self.vocab["Setup"].__getitem__, take(cols["Setup"])),
+            map(self.vocab["Entry Type"].__getitem__, take(cols["Entry Type"])),
+            map("${:.2f}".format, take(cols["P&L"])),
+            map("{:.2f}".format, take(cols["R:R"])),
+            map(("❌", "✅").__getitem__, take(cols["Win"])),
+            map("{} min".format, take(cols["Hold Time"])),
+        )
+        return values
+
+    def fill_table(self):
+        """Lists the filtered trades; only the first TABLE_ROW_CHUNK rows are inserted until scrolled to."""
+        children = self.tree.get_children()
+        if children: # One delete call for all rows; nothing to clear when the table is already empty
+            self.tree.delete(*children)
+        self._table_order = self._row_order()
+        self._table_rows = 0
+        self._insert_more_table_rows()
+
+    def _on_table_yview(self, first, last):
+        """Scrollbar callback of the table; inserts the next chunk of rows when the end comes into view."""
+        self._table_vsb.set(first, last)
+        if float(last) >= 0.9 and self._table_rows < len(self._table_order) and self._pending_rows is None:
+            self._pending_rows = self.after_idle(self._insert_more_table_rows)
+
+    def _insert_more_table_rows(self):
+        """Appends up to TABLE_ROW_CHUNK not-yet-inserted rows to the table."""
+        if self._pending_rows is not None: # Running now (or called directly), so the queued run isn't needed
+            self.after_cancel(self._pending_rows)
+            self._pending_rows = None
+        start = self._table_rows
+        end = min(len(self._table_order), start + TABLE_ROW_CHUNK)
+        if start >= end:
+            return # Already handled by an earlier idle callback
+        insert = self.tree.insert
+        for row_values in self._format_rows(self._table_order[start:end]):
+            insert("", "end", values=row_values)
+        self._table_rows = end
 
     def on_trade_select(self, event):
         selected_item = self.tree.focus()
@@ -182,8 +400,19 @@ class StatsPage(tk.Tk):
             messagebox.showinfo("Trade Details", f"Opening journal entry for Trade ID: {trade_id}\n\n(This would be a popup with full trade details)")
 
     def sort_column(self, col):
-        messagebox.showinfo("Sorting", f"Sorting by column: {col}\n\n(Implement actual sorting logic here)")
+        """Sorts the table on `col`; clicking the same heading again flips the direction."""
+        if col == self.sort_by:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            if self.sort_by is not None:
+                self.tree.heading(self.sort_by, text=self.sort_by)
+            self.sort_by, self.sort_reverse = col, False
+        self.tree.heading(col, text=f"{col} {'▼' if self.sort_reverse else '▲'}")
+        self.fill_table()
 
 if __name__ == "__main__":
-    app = StatsPage()
-    app.mainloop()
+    root = tk.Tk()
+    root.withdraw() # Standalone, the page is the only window; closing it ends the program
+    app = StatsPage(root)
+    app.protocol("WM_DELETE_WINDOW", root.destroy)
+    root.mainloop()